@@ -0,0 +1,175 @@
+import argparse
+import logging
+import os
+import queue
+import threading
+import time
+
+import job_scraper
+from glassdoor_locations import GlassdoorLocationResolver
+from load_test import QUERIES
+from mock_board import MockBoardConfig, start_mock_board
+
+logger = logging.getLogger(__name__)
+
+# ⏱️ Tabs in one browser vs. a pool of browsers
+#
+# Scrapes the same (query, source) pairs against mock_board.py twice: once
+# with `--tabs N` style scheduling (one Chrome, N tabs loading at once) and
+# once with a pool of N Chrome instances, each scraping pairs sequentially
+# through the normal scrape_* functions. Reports wall time, jobs per second
+# and the resident memory of the browser processes.
+
+
+# Resident memory (MB) of a process and all its descendants, from /proc (Linux)
+def process_tree_rss_mb(root_pid):
+    children = {}
+    rss_pages = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces; fields after it are fixed
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{entry}/statm") as f:
+                rss_pages[int(entry)] = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def browser_rss_mb(drivers):
+    try:
+        return sum(process_tree_rss_mb(driver.service.process.pid) for driver in drivers)
+    except (AttributeError, OSError):
+        return None
+
+
+# Samples browser memory in the background; keeps the peak
+class MemorySampler:
+    def __init__(self, drivers, interval=0.5):
+        self.drivers = drivers
+        self.interval = interval
+        self.peak = None
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stop.wait(self.interval):
+            rss = browser_rss_mb(self.drivers)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+
+
+def run_tabs(pairs, tabs, max_pages):
+    started = time.perf_counter()
+    driver = job_scraper.setup_driver()
+    setup = time.perf_counter() - started
+    try:
+        with MemorySampler([driver]) as sampler:
+            job_titles = list(dict.fromkeys(title for title, _ in pairs))
+            sources = list(dict.fromkeys(source for _, source in pairs))
+            results = job_scraper.scrape_in_tabs(driver, job_titles, sources, "New York", {}, None, max_pages,
+                                                 tab_count=tabs)
+    finally:
+        driver.quit()
+    elapsed = time.perf_counter() - started
+    return elapsed, setup, sum(len(jobs) for jobs in results.values()), sampler.peak
+
+
+def run_pool(pairs, size, max_pages):
+    started = time.perf_counter()
+    drivers = [job_scraper.setup_driver() for _ in range(size)]
+    setup = time.perf_counter() - started
+    work = queue.Queue()
+    for pair in pairs:
+        work.put(pair)
+    counts = []
+
+    def worker(driver):
+        while True:
+            try:
+                job_title, source = work.get_nowait()
+            except queue.Empty:
+                return
+            scrape = job_scraper.SOURCE_SCRAPE_FUNCTIONS[source]
+            counts.append(len(scrape(driver, job_title, "New York", {}, None, max_pages)))
+
+    try:
+        with MemorySampler(drivers) as sampler:
+            threads = [threading.Thread(target=worker, args=(driver,)) for driver in drivers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        for driver in drivers:
+            driver.quit()
+    elapsed = time.perf_counter() - started
+    return elapsed, setup, sum(counts), sampler.peak
+
+
+def print_result(label, elapsed, setup, jobs, peak_rss):
+    memory = f"{peak_rss:.0f} MB" if peak_rss is not None else "n/a"
+    print(f"{label:<22} total={elapsed:6.1f}s  browser startup={setup:5.1f}s  "
+          f"jobs={jobs:5d} ({jobs / elapsed:6.1f}/s)  peak browser RSS={memory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-tab scraping against a pool of browsers')
+    parser.add_argument('--base_url', type=str, help='Use an already running mock board instead of starting one')
+    parser.add_argument('--concurrency', type=int, default=4, help='Tabs in the single browser / browsers in the pool')
+    parser.add_argument('--queries', type=int, default=4, help=f'Number of search queries (up to {len(QUERIES)})')
+    parser.add_argument('--pages', type=int, default=3, help='Maximum result pages per source')
+    parser.add_argument('--sources', type=str, nargs='+', choices=list(job_scraper.SOURCE_BASE_URLS), help='Sources to scrape')
+    parser.add_argument('--latency_ms', type=float, default=500, help='Mock board: mean response latency')
+    parser.add_argument('--jitter_ms', type=float, default=100, help='Mock board: latency standard deviation')
+    parser.add_argument('--mode', choices=['both', 'tabs', 'pool'], default='both', help='Which strategy to run')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server, base_url = start_mock_board(MockBoardConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms))
+    for source in job_scraper.SOURCE_BASE_URLS:
+        job_scraper.SOURCE_BASE_URLS[source] = base_url
+    # Pacing delays would dominate both strategies equally
+    job_scraper.DELAY_SCALE = 0
+    # The mock board's location IDs are fake; keep them out of the shared cache file
+    job_scraper.GLASSDOOR_LOCATIONS = GlassdoorLocationResolver(cache_path=None)
+
+    sources = args.sources or list(job_scraper.SOURCE_BASE_URLS)
+    queries = QUERIES[:args.queries]
+    pairs = [(query, source) for query in queries for source in sources]
+
+    print(f"⏱️ {len(pairs)} (query, source) pairs, up to {args.pages} pages each, "
+          f"concurrency {args.concurrency}, against {base_url}")
+    try:
+        if args.mode in ('both', 'tabs'):
+            print_result(f"{args.concurrency} tabs, 1 browser", *run_tabs(pairs, args.concurrency, args.pages))
+        if args.mode in ('both', 'pool'):
+            print_result(f"{args.concurrency} browsers", *run_pool(pairs, args.concurrency, args.pages))
+    finally:
+        if server:
+            server.shutdown()
+
+if __name__ == "__main__":
+    main()
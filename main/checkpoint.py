@@ -0,0 +1,123 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 🔖 Checkpoint of completed (query, source, page) units
+#
+# Every listing page that finishes extraction is appended to a JSON-lines
+# file together with its jobs, its extraction counts and whether the
+# scraper went on to the next page. Each unit is a single line written and
+# fsynced in one go, so a crash leaves at most a torn last line, which is
+# ignored on load: a unit is either fully recorded or not at all. Appending
+# keeps the cost per unit constant however long the run gets.
+#
+# Jobs are never held in memory: recording only writes the line, and a
+# resumed run keeps just each unit's byte offset, reading the unit back
+# when the scraper reaches it.
+#
+# The first line describes the run (queries, location, filters, pages);
+# --resume only reuses units from a checkpoint of the same run. The file is
+# deleted once a run finishes, so only an interrupted run leaves one behind.
+
+
+def unit_key(job_title, source, page_num):
+    return (job_title, source, page_num)
+
+
+class Checkpoint:
+    def __init__(self, path, run, resume=False):
+        self.path = path
+        # Compared against the JSON read back from disk, so normalize it the same way
+        self.run = json.loads(json.dumps(run))
+        self.units = {}
+        self.resumed = 0
+        self.lock = threading.Lock()
+
+        if resume:
+            self._load()
+        else:
+            if os.path.exists(path):
+                logger.warning(f"Overwriting the checkpoint of an unfinished run in {path} (use --resume to continue it)")
+            self._start()
+
+    def _load(self):
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            logger.info(f"No checkpoint at {self.path}, starting a fresh run")
+            self._start()
+            return
+
+        run = None
+        good_end = 0
+        with f:
+            for line in iter(f.readline, b""):
+                # A line without its newline, or one that doesn't parse, is a torn write from a crash
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if run is None:
+                    run = record.get('run')
+                    if run != self.run:
+                        break
+                else:
+                    self.units[unit_key(record['job_title'], record['source'], record['page'])] = good_end
+                good_end += len(line)
+
+        if run is None or run != self.run:
+            logger.warning(f"Checkpoint {self.path} is from a different search, starting a fresh run")
+            self._start()
+            return
+
+        # Cut off any torn tail so new units append cleanly
+        os.truncate(self.path, good_end)
+        logger.info(f"Resuming from {self.path}: {len(self.units)} pages already done")
+
+    def _start(self):
+        self.units = {}
+        self._write([{'run': self.run}])
+
+    def _write(self, records):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    # The recorded unit ({'jobs', 'stats', 'more_pages', ...}) or None if it still has to be scraped
+    def get(self, job_title, source, page_num):
+        with self.lock:
+            offset = self.units.get(unit_key(job_title, source, page_num))
+            if offset is None:
+                return None
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                unit = json.loads(f.readline())
+            self.resumed += 1
+            return unit
+
+    def record(self, job_title, source, page_num, jobs, stats, more_pages):
+        unit = {'job_title': job_title, 'source': source, 'page': page_num,
+                'jobs': jobs, 'stats': stats, 'more_pages': more_pages}
+        line = json.dumps(unit) + "\n"
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    # The run completed: there is nothing left to resume
+    def finish(self):
+        with self.lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
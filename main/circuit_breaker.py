@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 🚧 Per-source circuit breaker
+#
+# A source whose result pages keep coming back empty or blocked (captcha,
+# changed DOM) is skipped for a cooldown instead of costing a page load,
+# a human-delay sleep and a full selector walk on every query. After the
+# cooldown a single probe request is let through: success closes the
+# circuit, failure re-opens it with the cooldown doubled (up to a cap).
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+# Text that shows up on block / bot-check pages instead of results
+BLOCK_MARKERS = (
+    "captcha", "verify you are a human", "are you a robot", "unusual traffic",
+    "access denied", "request blocked", "security check"
+)
+
+
+def looks_blocked(page_source):
+    text = (page_source or "").lower()
+    return any(marker in text for marker in BLOCK_MARKERS)
+
+
+class SourceHealth:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = 0
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self.probe_started = 0.0
+        self.trips = 0
+        self.skipped = 0
+        self.last_reason = None
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=2, base_cooldown=60, max_cooldown=900, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.sources = {}
+        self.lock = threading.Lock()
+
+    def _health(self, source):
+        if source not in self.sources:
+            self.sources[source] = SourceHealth()
+        return self.sources[source]
+
+    # Whether a request to `source` should go ahead now
+    def allow_request(self, source):
+        with self.lock:
+            health = self._health(source)
+            if health.state == CLOSED:
+                return True
+            if health.state == OPEN and self.clock() >= health.open_until:
+                health.state = HALF_OPEN
+                health.probe_in_flight = False
+                logger.info(f"{source} circuit half-open, sending a probe request")
+            # A probe that never reported back (e.g. page not fetched) is given up on after a cooldown
+            probe_stale = self.clock() - health.probe_started >= self.base_cooldown
+            if health.state == HALF_OPEN and (not health.probe_in_flight or probe_stale):
+                health.probe_in_flight = True
+                health.probe_started = self.clock()
+                return True
+            health.skipped += 1
+            return False
+
+    def record_success(self, source):
+        with self.lock:
+            health = self._health(source)
+            if health.state != CLOSED:
+                logger.info(f"{source} circuit closed, source is responding again")
+            health.state = CLOSED
+            health.failures = 0
+            health.cooldown = 0
+            health.probe_in_flight = False
+
+    def record_failure(self, source, reason="empty page"):
+        with self.lock:
+            health = self._health(source)
+            if health.state == OPEN:
+                # A request that was already in flight when the circuit opened; don't extend the cooldown again
+                return
+            health.failures += 1
+            health.last_reason = reason
+            if health.state == HALF_OPEN or health.failures >= self.failure_threshold:
+                # Exponential backoff on every consecutive trip
+                health.cooldown = min(self.max_cooldown, health.cooldown * 2 if health.cooldown else self.base_cooldown)
+                health.open_until = self.clock() + health.cooldown
+                health.state = OPEN
+                health.probe_in_flight = False
+                health.trips += 1
+                logger.warning(f"{source} circuit open for {health.cooldown:.0f}s after {health.failures} "
+                               f"consecutive failures ({reason})")
+
+    def summary(self):
+        with self.lock:
+            lines = []
+            for source, health in self.sources.items():
+                line = f"{source}: {health.state}"
+                if health.trips:
+                    line += f" ({health.trips} trips, {health.skipped} requests skipped, last: {health.last_reason})"
+                if health.state == OPEN:
+                    line += f", retry in {max(0.0, health.open_until - self.clock()):.0f}s"
+                lines.append(line)
+            return lines
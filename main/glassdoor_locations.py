@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from urllib.parse import quote, urlsplit
+from urllib.request import Request, urlopen
+
+logger = logging.getLogger(__name__)
+
+# 📍 Map free-text locations to Glassdoor location IDs
+#
+# Glassdoor search URLs carry the location as a typed ID (IC1132348 = New
+# York City, IS... = a state, IN1 = United States). IDs come from the
+# site's location autocomplete endpoint and are cached in a JSON file, so
+# each distinct location costs one lookup ever rather than one per query.
+# The cache is kept per host, so IDs handed out by a mock board (--base_url,
+# load tests) never end up in real Glassdoor searches.
+
+# Autocomplete locationType -> URL prefix
+LOCATION_TYPE_PREFIXES = {'C': 'IC', 'S': 'IS', 'N': 'IN', 'M': 'IM'}
+
+# Used when no location is given
+UNITED_STATES = {'prefix': 'IN', 'id': 1, 'label': 'United States'}
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+
+
+def normalize_location(location):
+    return " ".join(location.lower().replace(",", " ").split())
+
+
+def location_host(base_url):
+    return urlsplit(base_url).netloc.lower()
+
+
+class GlassdoorLocationResolver:
+    # cache_path=None keeps lookups in memory only
+    def __init__(self, cache_path="glassdoor_locations.json", offline=False, timeout=10):
+        self.cache_path = cache_path
+        # Offline resolvers (replay mode) only answer from the cache
+        self.offline = offline
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.misses = set()
+        self.cache = self._load()
+
+    # {host: {normalized location: result}}
+    def _load(self):
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Glassdoor location cache unreadable, starting fresh: {e}")
+            return {}
+
+    def _save(self):
+        if self.cache_path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    # {'prefix': 'IC', 'id': 1132348, 'label': ...} or None if unknown
+    def resolve(self, location, base_url="https://www.glassdoor.com"):
+        if not location or not location.strip():
+            return UNITED_STATES
+
+        host = location_host(base_url)
+        key = normalize_location(location)
+        with self.lock:
+            known = self.cache.get(host, {})
+            if key in known:
+                return known[key]
+            if (host, key) in self.misses or self.offline:
+                return None
+
+            result = self._lookup(location, base_url)
+            if result:
+                self.cache.setdefault(host, {})[key] = result
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning(f"Could not save Glassdoor location cache: {e}")
+            else:
+                # Don't retry a failed lookup for every query in the run
+                self.misses.add((host, key))
+            return result
+
+    def _lookup(self, location, base_url):
+        url = f"{base_url}/findPopularLocationAjax.htm?term={quote(location)}&maxLocationsToReturn=10"
+        try:
+            request = Request(url, headers={'User-Agent': USER_AGENT, 'Accept': 'application/json'})
+            with urlopen(request, timeout=self.timeout) as response:
+                candidates = json.loads(response.read().decode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Glassdoor location lookup failed for '{location}': {e}")
+            return None
+
+        for candidate in candidates or []:
+            prefix = LOCATION_TYPE_PREFIXES.get(candidate.get('locationType'))
+            if prefix and candidate.get('locationId'):
+                logger.info(f"Resolved Glassdoor location '{location}' to {candidate.get('label')} ({prefix}{candidate['locationId']})")
+                return {'prefix': prefix, 'id': int(candidate['locationId']), 'label': candidate.get('label', location)}
+
+        logger.warning(f"No Glassdoor location matches '{location}'")
+        return None
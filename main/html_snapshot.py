@@ -0,0 +1,235 @@
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+try:
+    import lxml.html
+except ImportError:  # optional: lxml parses large pages much faster, html.parser is the fallback
+    lxml = None
+
+# Offline stand-in for the small part of the Selenium API the scrapers use
+# (find_elements / .text / get_attribute), backed by a saved page_source.
+# Lets cached pages go through the exact same extraction code as live pages.
+# The tree is built with lxml when it's installed, else with html.parser.
+
+# Selenium's By constants are plain strings; repeat them here so this module
+# can be used without importing selenium (e.g. in replay mode).
+BY_CLASS_NAME = "class name"
+BY_CSS_SELECTOR = "css selector"
+BY_TAG_NAME = "tag name"
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+HIDDEN_TAGS = {"script", "style", "noscript", "template", "head", "title"}
+URL_ATTRIBUTES = {"href", "src"}
+
+_COMPOUND_RE = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<rest>(?:\.[\w-]+|\[[^\]]+\])*)$"
+)
+_PART_RE = re.compile(r"\.([\w-]+)|\[([\w-]+)(\s*=\s*(['\"]?)(.*?)\4)?\]")
+
+
+class SnapshotElement:
+    def __init__(self, tag, attrs, parent=None, base_url=None):
+        self.tag_name = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.base_url = base_url
+        self.children = []  # SnapshotElement or str
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    @property
+    def text(self):
+        parts = []
+        self._collect_text(parts)
+        return " ".join(" ".join(parts).split())
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag_name not in HIDDEN_TAGS:
+                child._collect_text(parts)
+
+    def get_attribute(self, name):
+        value = self.attrs.get(name)
+        # Selenium reports href/src as absolute URLs; do the same
+        if value is not None and name in URL_ATTRIBUTES and self.base_url:
+            return urljoin(self.base_url, value)
+        return value
+
+    def iter_descendants(self):
+        stack = [c for c in reversed(self.children) if not isinstance(c, str)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(c for c in reversed(node.children) if not isinstance(c, str))
+
+    def find_elements(self, by, value):
+        if by == BY_CLASS_NAME:
+            # Compound class names ("metadata.salary") require every class
+            wanted = [c for c in value.split(".") if c]
+            return [el for el in self.iter_descendants() if all(c in el.classes for c in wanted)]
+        if by == BY_TAG_NAME:
+            value = value.lower()
+            return [el for el in self.iter_descendants() if el.tag_name == value]
+        if by == BY_CSS_SELECTOR:
+            return self._select(value)
+        raise ValueError(f"Unsupported locator strategy for snapshots: {by}")
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise LookupError(f"No element matches {by}={value!r}")
+        return elements[0]
+
+    def click(self):
+        # Snapshots are static; interactions are no-ops
+        pass
+
+    # Supports comma-separated groups of descendant-combined compound
+    # selectors (tag.class[attr='value']), which covers every selector used
+    # by the scrapers.
+    def _select(self, selector):
+        results = []
+        seen = set()
+        for group in selector.split(","):
+            steps = [_parse_compound(part) for part in group.split()]
+            if not steps:
+                continue
+            for el in self.iter_descendants():
+                if id(el) not in seen and _matches(el, steps[-1]) and _ancestors_match(el, steps[:-1], self):
+                    seen.add(id(el))
+                    results.append(el)
+        return results
+
+
+def _parse_compound(part):
+    match = _COMPOUND_RE.match(part)
+    if not match:
+        raise ValueError(f"Unsupported CSS selector for snapshots: {part}")
+    tag = match.group("tag")
+    classes, attrs = [], []
+    for cls, attr, eq, _, val in _PART_RE.findall(match.group("rest")):
+        if cls:
+            classes.append(cls)
+        else:
+            attrs.append((attr, val if eq else None))
+    return (tag.lower() if tag and tag != "*" else None, classes, attrs)
+
+
+def _matches(el, step):
+    tag, classes, attrs = step
+    if tag and el.tag_name != tag:
+        return False
+    if classes and not all(c in el.classes for c in classes):
+        return False
+    for name, val in attrs:
+        if name not in el.attrs:
+            return False
+        if val is not None and el.attrs[name] != val:
+            return False
+    return True
+
+
+def _ancestors_match(el, steps, root):
+    node = el.parent
+    for step in reversed(steps):
+        while node is not None and node is not root and not _matches(node, step):
+            node = node.parent
+        if node is None or node is root:
+            return False
+        node = node.parent
+    return True
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self, base_url=None):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.root = SnapshotElement("#document", {}, base_url=base_url)
+        self.stack = [self.root]
+
+    def _append(self, tag, attrs):
+        el = SnapshotElement(tag, {k: (v if v is not None else "") for k, v in attrs}, self.stack[-1], self.base_url)
+        self.stack[-1].children.append(el)
+        return el
+
+    def handle_starttag(self, tag, attrs):
+        el = self._append(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.append(el)
+
+    def handle_startendtag(self, tag, attrs):
+        self._append(tag, attrs)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open tag, tolerating unclosed children
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag_name == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def _parse_with_html_parser(html, base_url=None):
+    builder = _TreeBuilder(base_url)
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# Same tree as _TreeBuilder, converted from lxml's C parser output
+def _parse_with_lxml(html, base_url=None):
+    root = SnapshotElement("#document", {}, base_url=base_url)
+    stack = [(lxml.html.document_fromstring(html), root)]
+    while stack:
+        node, parent = stack.pop()
+        if isinstance(node.tag, str):
+            el = SnapshotElement(node.tag.lower(), dict(node.attrib), parent, base_url)
+            parent.children.append(el)
+            if node.text:
+                el.children.append(node.text)
+            # Children are pushed in reverse so they're appended in document order
+            stack.extend((child, el) for child in reversed(node))
+        # Text after a node (including comments) belongs to its parent
+        if node.tail:
+            parent.children.append(node.tail)
+    return root
+
+
+def parse_html(html, base_url=None):
+    if lxml is not None and html.strip():
+        try:
+            return _parse_with_lxml(html, base_url)
+        except ValueError:
+            # e.g. str input carrying an XML encoding declaration
+            pass
+    return _parse_with_html_parser(html, base_url)
+
+
+# Driver-like wrapper around a page snapshot, so scrapers can call
+# page.find_elements(...) the same way they do on a live WebDriver
+class SnapshotPage:
+    is_snapshot = True
+
+    def __init__(self, html, url=None, fetched_at=None):
+        self.page_source = html
+        self.current_url = url
+        # When the HTML was originally downloaded (epoch seconds), if known
+        self.fetched_at = fetched_at
+        self.root = parse_html(html, url)
+
+    def find_elements(self, by, value):
+        return self.root.find_elements(by, value)
+
+    def find_element(self, by, value):
+        return self.root.find_element(by, value)
@@ -0,0 +1,155 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+
+from posted_dates import parse_posted_date
+from ranking import tokenize
+from spill import dedup_key
+
+logger = logging.getLogger(__name__)
+
+# 🗂️ Local inverted index over every job scraped by past runs
+#
+# Stored in SQLite: `jobs` holds one row per distinct posting plus facet
+# columns (source, posting date, first/last seen, numeric salary), and `postings` maps
+# each token of the title, company and summary to the jobs containing it,
+# with the fields it came from. Runs add their jobs incrementally; queries
+# intersect posting lists and facet filters inside SQLite, so nothing is
+# loaded into memory beyond the rows returned.
+
+FIELD_CODES = {'title': 't', 'company': 'c', 'summary': 's'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT UNIQUE NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    salary TEXT,
+    salary_value REAL,
+    link TEXT,
+    posted_date TEXT,
+    posted_at REAL,
+    summary TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS jobs_posted_at ON jobs (posted_at);
+CREATE INDEX IF NOT EXISTS jobs_salary ON jobs (salary_value);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    job_id INTEGER NOT NULL,
+    fields TEXT NOT NULL,
+    PRIMARY KEY (term, job_id)
+) WITHOUT ROWID;
+"""
+
+# title:rust, company:fintech, summary:payments, or bare terms; trailing * for prefixes
+QUERY_TERM_RE = re.compile(r"(?:(title|company|summary):)?(\S+)")
+
+
+# Epoch seconds of a posting date (normalized "Date Posted" value), or None if unreadable
+def posted_timestamp(posted_date):
+    moment = parse_posted_date(posted_date)
+    return moment.timestamp() if moment else None
+
+
+# One row per posting the run itself would export: the same fields the scraper dedupes on
+def job_key(job):
+    raw = "|".join(dedup_key(job))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class JobIndex:
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # Add a run's jobs; postings already indexed only get their last_seen bumped.
+    # Returns the number of new jobs.
+    def add_jobs(self, jobs, salary_parser=None, seen_at=None):
+        seen_at = seen_at or time.time()
+        added = 0
+        with self.conn:
+            for job in jobs:
+                source, title, company, salary, link, posted_date, summary = job[:7]
+                key = job_key(job)
+                cur = self.conn.execute("UPDATE jobs SET last_seen = ? WHERE job_key = ?", (seen_at, key))
+                if cur.rowcount:
+                    continue
+
+                salary_value = salary_parser(salary) if salary_parser else None
+                cur = self.conn.execute(
+                    "INSERT INTO jobs (job_key, source, title, company, salary, salary_value, link, posted_date,"
+                    " posted_at, summary, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, source, title, company, salary, salary_value, link, posted_date,
+                     posted_timestamp(posted_date), summary, seen_at, seen_at)
+                )
+                self.conn.executemany(
+                    "INSERT INTO postings (term, job_id, fields) VALUES (?, ?, ?)",
+                    [(term, cur.lastrowid, fields) for term, fields in self._terms(title, company, summary).items()]
+                )
+                added += 1
+        return added
+
+    def _terms(self, title, company, summary):
+        terms = {}
+        for field, text in (('title', title), ('company', company), ('summary', summary)):
+            code = FIELD_CODES[field]
+            for token in tokenize(text):
+                if code not in terms.get(token, ""):
+                    terms[token] = terms.get(token, "") + code
+        return terms
+
+    # Jobs matching every query term and facet, most recently posted first
+    def search(self, query="", sources=None, days=None, min_salary=None, limit=50):
+        clauses, params = [], []
+
+        for field, raw in QUERY_TERM_RE.findall(query.lower()):
+            prefix = raw.endswith('*')
+            tokens = tokenize(raw.rstrip('*'))
+            for i, token in enumerate(tokens):
+                if prefix and i == len(tokens) - 1:
+                    # Range scan on the (term, job_id) primary key
+                    sub = "SELECT job_id FROM postings WHERE term >= ? AND term < ?"
+                    sub_params = [token, token + "￿"]
+                else:
+                    sub = "SELECT job_id FROM postings WHERE term = ?"
+                    sub_params = [token]
+                if field:
+                    sub += " AND instr(fields, ?) > 0"
+                    sub_params.append(FIELD_CODES[field])
+                clauses.append(f"id IN ({sub})")
+                params.extend(sub_params)
+
+        if sources:
+            clauses.append(f"source IN ({', '.join('?' for _ in sources)})")
+            params.extend(sources)
+        if days:
+            # By posting date; postings without a readable date fall back to when they were first scraped
+            clauses.append("(posted_at >= ? OR (posted_at IS NULL AND first_seen >= ?))")
+            cutoff = time.time() - days * 86400
+            params.extend([cutoff, cutoff])
+        if min_salary:
+            clauses.append("salary_value >= ?")
+            params.append(min_salary)
+
+        sql = "SELECT * FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY COALESCE(posted_at, first_seen) DESC, id DESC LIMIT ?"
+        params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
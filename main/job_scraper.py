@@ -1,5 +1,6 @@
 import time
 import random
+import csv
 import pandas as pd
 import gspread
 from selenium import webdriver
@@ -15,11 +16,46 @@ from datetime import datetime
 import logging
 import argparse
 import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from html_snapshot import SnapshotPage
+from job_index import JobIndex
+from page_cache import PageCache
+from circuit_breaker import CircuitBreaker, looks_blocked
+from posted_dates import normalize_posted_date, age_in_days
+from glassdoor_locations import GlassdoorLocationResolver
+from ranking import RelevanceRanker
+from spill import SpillingJobStore, HEADER, unique_jobs
+from tab_scheduler import TabScheduler, TabTask
+from checkpoint import Checkpoint
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Site roots used by the URL builders; --base_url points all of them at a
+# local stand-in (see mock_board.py) for end-to-end and load testing
+SOURCE_BASE_URLS = {
+    'Indeed': "https://www.indeed.com",
+    'Glassdoor': "https://www.glassdoor.com",
+    'LinkedIn': "https://www.linkedin.com",
+    'ZipRecruiter': "https://www.ziprecruiter.com"
+}
+
+# Glassdoor location IDs, cached on disk across runs
+GLASSDOOR_LOCATIONS = GlassdoorLocationResolver("glassdoor_locations.json")
+
+# Multiplier for the randomized "human" pause after each page load
+# (0 disables it, e.g. against the mock board)
+DELAY_SCALE = 1.0
+
+# Per-source card counts from extraction: cards seen, cards fully extracted,
+# and cards skipped early by field (see skip_card)
+EXTRACTION_STATS = {}
+EXTRACTION_STATS_LOCK = threading.Lock()
+
 # 🔧 Configure Headless Selenium WebDriver for macOS
 def setup_driver():
     options = Options()
@@ -37,12 +73,190 @@ def setup_driver():
         logger.error(f"Failed to set up WebDriver: {e}")
         raise
 
-# 🏗️ Function to Get Job Data from Indeed
-def scrape_indeed(driver, job_title, location, filters=None):
-    logger.info(f"Scraping Indeed for {job_title} in {location}")
+# 📥 Load a listing page, going through the page cache when one is configured.
+# Returns something with find_elements(): the live driver, a SnapshotPage for
+# cache hits, or None when replaying and the page was never cached.
+def fetch_listing_page(driver, url, filters=None, cache=None, delay=(3, 6), prepare=None):
+    if cache:
+        cached = cache.get_with_time(url, filters)
+        if cached is not None:
+            logger.info(f"Page cache hit for {url}")
+            html, stored_at = cached
+            return SnapshotPage(html, url, fetched_at=stored_at)
+    
+    if driver is None:
+        logger.warning(f"No cached page for {url}, skipping (replay mode)")
+        return None
+    
+    driver.get(url)
+    time.sleep(random.uniform(*delay) * DELAY_SCALE)  # Mimic human behavior
+    
+    # Source-specific interaction (popups, filter clicks) before snapshotting
+    if prepare:
+        prepare(driver)
+    
+    if cache:
+        cache.put(url, driver.page_source, filters)
+    return driver
+
+# 📸 Like fetch_listing_page, but reads page_source exactly once and returns
+# (html, fetched_at) so the page can be parsed elsewhere while the browser
+# moves on. None when replaying and the page was never cached.
+def fetch_page_source(driver, url, filters=None, cache=None, delay=(3, 6), prepare=None):
+    if cache:
+        cached = cache.get_with_time(url, filters)
+        if cached is not None:
+            logger.info(f"Page cache hit for {url}")
+            return cached
+    
+    if driver is None:
+        logger.warning(f"No cached page for {url}, skipping (replay mode)")
+        return None
+    
+    driver.get(url)
+    time.sleep(random.uniform(*delay) * DELAY_SCALE)  # Mimic human behavior
+    if prepare:
+        prepare(driver)
+    
+    fetched_at = time.time()
+    html = driver.page_source
+    if cache:
+        cache.put(url, html, filters)
+    return html, fetched_at
+
+# 🚦 Test a card's cheap field against the post-scrape criteria as soon as it's
+# read, so cards that filter_jobs would drop never get their links, dates and
+# summaries extracted. Missing titles/companies are skipped the same way.
+def card_passes(filters, field, value):
+    if field in ('title', 'company') and not value:
+        return False
+    if not filters:
+        return True
+    
+    if field == 'title' and filters.get('keywords'):
+        return any(keyword.lower() in value.lower() for keyword in filters['keywords'])
+    if field == 'company' and filters.get('companies'):
+        return any(company_name.lower() in value.lower() for company_name in filters['companies'])
+    if field == 'salary' and filters.get('salary_min'):
+        salary_value = parse_salary(value)
+        return bool(salary_value and salary_value >= filters['salary_min'])
+    return True
+
+def skip_card(stats, filters, field, value):
+    if card_passes(filters, field, value):
+        return False
+    key = f"skipped_{field}"
+    stats[key] = stats.get(key, 0) + 1
+    return True
+
+def record_extraction_stats(source, page_stats):
+    with EXTRACTION_STATS_LOCK:
+        totals = EXTRACTION_STATS.setdefault(source, {})
+        for key, count in page_stats.items():
+            totals[key] = totals.get(key, 0) + count
+
+# 📅 Replace each job's posted text with an absolute UTC timestamp; returns the
+# age in days of the last dated posting on the page (None if none were dated)
+def normalize_page_dates(page_jobs, fetched_at):
+    last_age = None
+    for job in page_jobs:
+        job[5] = normalize_posted_date(job[5], fetched_at)
+        age = age_in_days(job[5], fetched_at)
+        if age is not None:
+            last_age = age
+    return last_age
+
+# 🧾 Extract one loaded listing page, report it to the circuit breaker and
+# decide whether the next page is worth fetching. Returns (jobs, more_pages).
+def harvest_listing_page(source, page, parse_page, page_num, filters=None, max_pages=1, breaker=None,
+                         checkpoint=None, job_title=None):
+    page_stats = {}
+    page_jobs = parse_page(page, filters, page_stats)
+    return finish_listing_page(source, page_jobs, page_stats, page_num, getattr(page, 'fetched_at', None) or time.time(),
+                               lambda: page.page_source, filters, max_pages, breaker, checkpoint, job_title)
+
+# Everything after card extraction; `get_page_source` is only called to tell a block page from an empty one
+def finish_listing_page(source, page_jobs, page_stats, page_num, fetched_at, get_page_source, filters=None,
+                        max_pages=1, breaker=None, checkpoint=None, job_title=None):
+    record_extraction_stats(source, page_stats)
+    if not page_stats.get('cards'):
+        # An empty first page means a block or a changed DOM; an empty later page is just the end of results
+        if page_num == 0 and looks_blocked(get_page_source()):
+            # Not checkpointed: a resumed run should try the source again
+            if breaker:
+                breaker.record_failure(source, "blocked")
+            return [], False
+        if breaker and page_num == 0:
+            breaker.record_failure(source, "no job cards")
+        page_jobs, more_pages = [], False
+    else:
+        if breaker:
+            breaker.record_success(source)
+        
+        oldest_age = normalize_page_dates(page_jobs, fetched_at)
+        more_pages = page_num + 1 < max_pages
+        
+        # Later pages would only hold older postings that filter_jobs drops anyway
+        max_days_old = (filters or {}).get('max_days_old')
+        if max_days_old and oldest_age is not None and oldest_age > max_days_old and more_pages:
+            logger.info(f"Stopping {source} after page {page_num + 1}: postings are older than {max_days_old} days")
+            more_pages = False
+    
+    if checkpoint:
+        checkpoint.record(job_title, source, page_num, page_jobs, page_stats, more_pages)
+    return page_jobs, more_pages
+
+# A page finished by an earlier, interrupted run: (jobs, more_pages) from the
+# checkpoint with its extraction counts re-added, or None if it still has to be scraped
+def resume_listing_page(checkpoint, job_title, source, page_num):
+    unit = checkpoint.get(job_title, source, page_num) if checkpoint else None
+    if unit is None:
+        return None
+    logger.info(f"Skipping {source} page {page_num + 1} for {job_title}: already in checkpoint")
+    record_extraction_stats(source, unit['stats'])
+    return unit['jobs'], unit['more_pages']
+
+# 📄 Walk a source's result pages, stopping early at the first empty page
+# or once postings are older than max_days_old (results are newest-first)
+def scrape_pages(source, driver, build_url, parse_page, job_title, location, filters=None, cache=None,
+                 max_pages=1, delay=(3, 6), prepare=None, breaker=None, checkpoint=None):
+    logger.info(f"Scraping {source} for {job_title} in {location}")
+    
+    job_list = []
+    try:
+        for page_num in range(max_pages):
+            resumed = resume_listing_page(checkpoint, job_title, source, page_num)
+            if resumed is not None:
+                page_jobs, more_pages = resumed
+            else:
+                if breaker and not breaker.allow_request(source):
+                    logger.info(f"Skipping {source}: circuit open")
+                    break
+                
+                url = build_url(job_title, location, filters, page_num)
+                page = fetch_listing_page(driver, url, filters, cache, delay, prepare)
+                if page is None:
+                    break
+                
+                page_jobs, more_pages = harvest_listing_page(source, page, parse_page, page_num, filters, max_pages,
+                                                             breaker, checkpoint, job_title)
+            job_list.extend(page_jobs)
+            if not more_pages:
+                break
+        
+        logger.info(f"Successfully scraped {len(job_list)} jobs from {source}")
+        return job_list
     
-    # Build URL with filters
-    url = f"https://www.indeed.com/jobs?q={job_title.replace(' ', '+')}"
+    except Exception as e:
+        logger.error(f"Error scraping {source}: {e}")
+        if breaker:
+            breaker.record_failure(source, f"error: {e}")
+        # Keep whatever earlier pages produced
+        return job_list
+
+# 🔗 Build Indeed search URL with filters
+def build_indeed_url(job_title, location, filters=None, page_num=0):
+    url = f"{SOURCE_BASE_URLS['Indeed']}/jobs?q={job_title.replace(' ', '+')}"
     
     # Add location
     if location:
@@ -77,267 +291,286 @@ def scrape_indeed(driver, job_title, location, filters=None):
         if filters.get('remote'):
             url += "&remotejob=1"
     
-    try:
-        driver.get(url)
-        time.sleep(random.uniform(3, 6))  # Mimic human behavior
-        
-        job_list = []
-        
-        # Try different selectors as Indeed often changes their DOM structure
-        possible_job_selectors = [
-            "job_seen_beacon",
-            "jobsearch-ResultsList",
-            "tapItem",
-            "job_seen_beacon"
-        ]
-        
-        jobs = []
-        for selector in possible_job_selectors:
-            jobs = driver.find_elements(By.CLASS_NAME, selector)
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on Indeed using selector: {selector}")
-                break
-        
-        if not jobs:
-            # Try a more generic approach
-            jobs = driver.find_elements(By.CSS_SELECTOR, "div[data-testid='jobListing']")
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on Indeed using generic selector")
-            else:
-                logger.warning("No jobs found on Indeed. The page structure might have changed.")
-        
-        for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
-            try:
-                # Use multiple possible selectors for each element
-                title = None
-                for selector in ["jobTitle", "title", "jobName"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        title = elements[0].text
-                        break
-                
-                company = None
-                for selector in ["companyName", "company", "companyInfo"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        company = elements[0].text
-                        break
-                
-                salary = "N/A"
-                for selector in ["salary-snippet-container", "salaryOnly", "metadata salary"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector.replace(" ", "."))
-                    if elements:
-                        salary = elements[0].text
-                        break
-                
-                link = None
-                elements = job.find_elements(By.TAG_NAME, "a")
+    # Indeed pages by result offset, 10 per page
+    if page_num:
+        url += f"&start={page_num * 10}"
+    
+    return url
+
+# 🧩 Extract job cards from a loaded Indeed results page
+def parse_indeed_page(page, filters=None, stats=None):
+    job_list = []
+    stats = stats if stats is not None else {}
+    
+    # Try different selectors as Indeed often changes their DOM structure
+    possible_job_selectors = [
+        "job_seen_beacon",
+        "jobsearch-ResultsList",
+        "tapItem",
+        "job_seen_beacon"
+    ]
+    
+    jobs = []
+    for selector in possible_job_selectors:
+        jobs = page.find_elements(By.CLASS_NAME, selector)
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on Indeed using selector: {selector}")
+            break
+    
+    if not jobs:
+        # Try a more generic approach
+        jobs = page.find_elements(By.CSS_SELECTOR, "div[data-testid='jobListing']")
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on Indeed using generic selector")
+        else:
+            logger.warning("No jobs found on Indeed. The page structure might have changed.")
+    
+    stats['cards'] = stats.get('cards', 0) + len(jobs[:20])
+    for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
+        try:
+            # Use multiple possible selectors for each element
+            title = None
+            for selector in ["jobTitle", "title", "jobName"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
                 if elements:
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and "job" in href:
-                            link = href
-                            break
-                
-                posted_date = "N/A"
-                for selector in ["date", "jobAge", "jobAgeDays"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        posted_date = elements[0].text
-                        break
-                
-                summary = "N/A"
-                for selector in ["job-snippet", "jobDescription", "summary"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        summary = elements[0].text
-                        break
-                
-                if title and company:
-                    job_list.append(["Indeed", title, company, salary, link or "N/A", posted_date, summary])
-            except Exception as e:
-                logger.warning(f"Error parsing Indeed job: {e}")
+                    title = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'title', title):
                 continue
-        
-        logger.info(f"Successfully scraped {len(job_list)} jobs from Indeed")
-        return job_list
+            
+            company = None
+            for selector in ["companyName", "company", "companyInfo"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    company = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'company', company):
+                continue
+            
+            salary = "N/A"
+            for selector in ["salary-snippet-container", "salaryOnly", "metadata salary"]:
+                elements = job.find_elements(By.CLASS_NAME, selector.replace(" ", "."))
+                if elements:
+                    salary = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'salary', salary):
+                continue
+            
+            link = None
+            elements = job.find_elements(By.TAG_NAME, "a")
+            if elements:
+                for element in elements:
+                    href = element.get_attribute("href")
+                    if href and "job" in href:
+                        link = href
+                        break
+            
+            posted_date = "N/A"
+            for selector in ["date", "jobAge", "jobAgeDays"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    posted_date = elements[0].text
+                    break
+            
+            summary = "N/A"
+            for selector in ["job-snippet", "jobDescription", "summary"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    summary = elements[0].text
+                    break
+            
+            stats['extracted'] = stats.get('extracted', 0) + 1
+            if title and company:
+                job_list.append(["Indeed", title, company, salary, link or "N/A", posted_date, summary])
+        except Exception as e:
+            logger.warning(f"Error parsing Indeed job: {e}")
+            continue
     
-    except Exception as e:
-        logger.error(f"Error scraping Indeed: {e}")
-        return []
+    return job_list
 
-# 🏗️ Function to Get Job Data from Glassdoor
-def scrape_glassdoor(driver, job_title, location, filters=None):
-    logger.info(f"Scraping Glassdoor for {job_title} in {location}")
-    
-    # Build URL with basic parameters
-    location_formatted = location.replace(' ', '-').lower() if location else "united-states"
+# 🏗️ Function to Get Job Data from Indeed
+def scrape_indeed(driver, job_title, location, filters=None, cache=None, max_pages=1, breaker=None, checkpoint=None):
+    return scrape_pages("Indeed", driver, build_indeed_url, parse_indeed_page, job_title, location,
+                        filters, cache, max_pages, delay=(3, 6), breaker=breaker, checkpoint=checkpoint)
+
+# 🔗 Build Glassdoor search URL with filters
+def build_glassdoor_url(job_title, location, filters=None, page_num=0):
     job_title_formatted = job_title.replace(' ', '-').lower()
     
-    # Base URL structure
-    url = f"https://www.glassdoor.com/Job/{location_formatted}-{job_title_formatted}-jobs-SRCH_IL.0,{len(location_formatted)}_IC1132348_KO{len(location_formatted)+1},{len(location_formatted)+1+len(job_title_formatted)}.htm"
+    # Later pages append _IP<n> before the extension
+    page_suffix = f"_IP{page_num + 1}" if page_num else ""
     
-    try:
-        driver.get(url)
-        time.sleep(random.uniform(4, 7))  # Glassdoor can be slower to load
+    params = []
+    resolved = GLASSDOOR_LOCATIONS.resolve(location, SOURCE_BASE_URLS['Glassdoor'])
+    if resolved:
+        # Base URL structure: <location>-<title>-jobs-SRCH_IL.<location span>_<location id>_KO<title span>
+        location_formatted = (location or resolved['label']).replace(',', '').replace(' ', '-').lower()
+        url = f"{SOURCE_BASE_URLS['Glassdoor']}/Job/{location_formatted}-{job_title_formatted}-jobs-SRCH_IL.0,{len(location_formatted)}_{resolved['prefix']}{resolved['id']}_KO{len(location_formatted)+1},{len(location_formatted)+1+len(job_title_formatted)}{page_suffix}.htm"
+    else:
+        # Unknown location ID: keyword-only search, letting Glassdoor geocode the location text
+        url = f"{SOURCE_BASE_URLS['Glassdoor']}/Job/{job_title_formatted}-jobs-SRCH_KO0,{len(job_title_formatted)}{page_suffix}.htm"
+        params.append(f"locKeyword={location.replace(' ', '+')}")
+    
+    # Filters go in the query string, so a filtered search is a single page load
+    if filters:
+        if filters.get('date_posted'):
+            # Glassdoor counts age in days (1 = last 24 hours)
+            date_map = {'24h': '1', '3d': '3', '7d': '7', '14d': '14', '30d': '30'}
+            date_val = date_map.get(filters['date_posted'], '')
+            if date_val:
+                params.append(f"fromAge={date_val}")
         
-        # Handle Glassdoor sign-in popup if it appears
-        try:
-            close_buttons = driver.find_elements(By.CSS_SELECTOR, "span.SVGInline.modal_closeIcon")
-            if close_buttons:
-                close_buttons[0].click()
-                time.sleep(1)
-        except Exception as e:
-            logger.warning(f"Could not close Glassdoor popup: {e}")
+        if filters.get('job_type'):
+            type_map = {'full_time': 'fulltime', 'part_time': 'parttime', 'contract': 'contract', 'temporary': 'temporary', 'internship': 'internship'}
+            type_val = type_map.get(filters['job_type'], '')
+            if type_val:
+                params.append(f"jobType={type_val}")
         
-        # Apply filters
-        if filters:
-            try:
-                # Click "More" button to show filters
-                more_button = driver.find_elements(By.CSS_SELECTOR, "button[data-test='filters-more']")
-                if more_button:
-                    more_button[0].click()
-                    time.sleep(1)
-                
-                # Date posted filter
-                if filters.get('date_posted'):
-                    date_map = {'24h': '1d', '3d': '3d', '7d': '7d', '14d': '14d', '30d': '30d'}
-                    date_val = date_map.get(filters['date_posted'], '')
-                    if date_val:
-                        date_buttons = driver.find_elements(By.CSS_SELECTOR, f"[data-test='DATEPOSTED_{date_val}']")
-                        if date_buttons:
-                            date_buttons[0].click()
-                            time.sleep(1)
-                
-                # Job type filter
-                if filters.get('job_type'):
-                    type_map = {'full_time': 'fulltime', 'part_time': 'parttime', 'contract': 'contract', 'temporary': 'temporary', 'internship': 'internship'}
-                    type_val = type_map.get(filters['job_type'], '')
-                    if type_val:
-                        type_buttons = driver.find_elements(By.CSS_SELECTOR, f"[data-test='JOBTYPE_{type_val.upper()}']")
-                        if type_buttons:
-                            type_buttons[0].click()
-                            time.sleep(1)
-                
-                # Experience level filter
-                if filters.get('experience_level'):
-                    exp_map = {'entry': 'entrylevel', 'mid': 'midlevel', 'senior': 'seniorlevel'}
-                    exp_val = exp_map.get(filters['experience_level'], '')
-                    if exp_val:
-                        exp_buttons = driver.find_elements(By.CSS_SELECTOR, f"[data-test='EXPERIENCE_{exp_val.upper()}']")
-                        if exp_buttons:
-                            exp_buttons[0].click()
-                            time.sleep(1)
-                
-                # Apply filters button
-                apply_buttons = driver.find_elements(By.CSS_SELECTOR, "[data-test='apply-filters']")
-                if apply_buttons:
-                    apply_buttons[0].click()
-                    time.sleep(2)
-            
-            except Exception as e:
-                logger.warning(f"Error applying Glassdoor filters: {e}")
-        
-        job_list = []
-        
-        # Try different possible job listing selectors
-        possible_job_selectors = [
-            "react-job-listing",
-            "jobCard",
-            "JobCard_jobCard__JGRMQ"
-        ]
-        
-        jobs = []
-        for selector in possible_job_selectors:
-            jobs = driver.find_elements(By.CLASS_NAME, selector)
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on Glassdoor using selector: {selector}")
-                break
+        if filters.get('experience_level'):
+            exp_map = {'entry': 'entrylevel', 'mid': 'midseniorlevel', 'senior': 'seniorlevel'}
+            exp_val = exp_map.get(filters['experience_level'], '')
+            if exp_val:
+                params.append(f"seniorityType={exp_val}")
         
-        if not jobs:
-            # Try a generic approach
-            jobs = driver.find_elements(By.CSS_SELECTOR, "li[data-id]")
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on Glassdoor using generic selector")
-            else:
-                logger.warning("No jobs found on Glassdoor. The page structure might have changed.")
+        if filters.get('salary_min'):
+            params.append(f"minSalary={filters['salary_min']}")
         
-        for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
-            try:
-                # Try multiple selectors for each element
-                title = None
-                for selector in ["jobLink", "job-title", "jobTitle"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        title = elements[0].text
-                        break
-                if not title:
-                    elements = job.find_elements(By.CSS_SELECTOR, "a[data-test='job-link']")
-                    if elements:
-                        title = elements[0].text
-                
-                company = None
-                for selector in ["d-flex", "employer-name", "companyName"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        company = elements[0].text
-                        break
-                if not company:
-                    elements = job.find_elements(By.CSS_SELECTOR, "[data-test='employer-name']")
-                    if elements:
-                        company = elements[0].text
-                
-                salary = "N/A"
-                for selector in ["css-1hbqxax", "salary-estimate", "salaryEstimate"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        salary = elements[0].text
-                        break
-                if salary == "N/A":
-                    elements = job.find_elements(By.CSS_SELECTOR, "[data-test='detailSalary']")
-                    if elements:
-                        salary = elements[0].text
-                
-                link = None
-                elements = job.find_elements(By.TAG_NAME, "a")
+        if filters.get('remote'):
+            params.append("remoteWorkType=1")
+    
+    if params:
+        url += "?" + "&".join(params)
+    return url
+
+# 🖱️ Dismiss the Glassdoor sign-in popup if it appears
+def prepare_glassdoor_page(driver):
+    try:
+        close_buttons = driver.find_elements(By.CSS_SELECTOR, "span.SVGInline.modal_closeIcon")
+        if close_buttons:
+            close_buttons[0].click()
+            time.sleep(1)
+    except Exception as e:
+        logger.warning(f"Could not close Glassdoor popup: {e}")
+
+# 🧩 Extract job cards from a loaded Glassdoor results page
+def parse_glassdoor_page(page, filters=None, stats=None):
+    job_list = []
+    stats = stats if stats is not None else {}
+    
+    # Try different possible job listing selectors
+    possible_job_selectors = [
+        "react-job-listing",
+        "jobCard",
+        "JobCard_jobCard__JGRMQ"
+    ]
+    
+    jobs = []
+    for selector in possible_job_selectors:
+        jobs = page.find_elements(By.CLASS_NAME, selector)
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on Glassdoor using selector: {selector}")
+            break
+    
+    if not jobs:
+        # Try a generic approach
+        jobs = page.find_elements(By.CSS_SELECTOR, "li[data-id]")
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on Glassdoor using generic selector")
+        else:
+            logger.warning("No jobs found on Glassdoor. The page structure might have changed.")
+    
+    stats['cards'] = stats.get('cards', 0) + len(jobs[:20])
+    for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
+        try:
+            # Try multiple selectors for each element
+            title = None
+            for selector in ["jobLink", "job-title", "jobTitle"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
                 if elements:
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and "/job-listing/" in href:
-                            link = href
-                            break
-                
-                # Glassdoor doesn't always show post date in the listing
-                posted_date = "N/A"
-                
-                # Get summary if available
-                summary = "N/A"
-                for selector in ["jobDescriptionContent", "description", "jobDesc"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        summary = elements[0].text[:200] + "..." if len(elements[0].text) > 200 else elements[0].text
-                        break
-                
-                if title and company:
-                    job_list.append(["Glassdoor", title, company, salary, link or "N/A", posted_date, summary])
+                    title = elements[0].text
+                    break
+            if not title:
+                elements = job.find_elements(By.CSS_SELECTOR, "a[data-test='job-link']")
+                if elements:
+                    title = elements[0].text
             
-            except Exception as e:
-                logger.warning(f"Error parsing Glassdoor job: {e}")
+            if skip_card(stats, filters, 'title', title):
                 continue
+            
+            company = None
+            for selector in ["d-flex", "employer-name", "companyName"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    company = elements[0].text
+                    break
+            if not company:
+                elements = job.find_elements(By.CSS_SELECTOR, "[data-test='employer-name']")
+                if elements:
+                    company = elements[0].text
+            
+            if skip_card(stats, filters, 'company', company):
+                continue
+            
+            salary = "N/A"
+            for selector in ["css-1hbqxax", "salary-estimate", "salaryEstimate"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    salary = elements[0].text
+                    break
+            if salary == "N/A":
+                elements = job.find_elements(By.CSS_SELECTOR, "[data-test='detailSalary']")
+                if elements:
+                    salary = elements[0].text
+            
+            if skip_card(stats, filters, 'salary', salary):
+                continue
+            
+            link = None
+            elements = job.find_elements(By.TAG_NAME, "a")
+            if elements:
+                for element in elements:
+                    href = element.get_attribute("href")
+                    if href and "/job-listing/" in href:
+                        link = href
+                        break
+            
+            # Glassdoor doesn't always show post date in the listing; when it does it's a compact age ("3d", "24h", "30d+")
+            posted_date = "N/A"
+            elements = job.find_elements(By.CSS_SELECTOR, "[data-test='job-age']")
+            if elements and elements[0].text:
+                posted_date = elements[0].text
+            
+            # Get summary if available
+            summary = "N/A"
+            for selector in ["jobDescriptionContent", "description", "jobDesc"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    summary = elements[0].text[:200] + "..." if len(elements[0].text) > 200 else elements[0].text
+                    break
+            
+            stats['extracted'] = stats.get('extracted', 0) + 1
+            if title and company:
+                job_list.append(["Glassdoor", title, company, salary, link or "N/A", posted_date, summary])
         
-        logger.info(f"Successfully scraped {len(job_list)} jobs from Glassdoor")
-        return job_list
+        except Exception as e:
+            logger.warning(f"Error parsing Glassdoor job: {e}")
+            continue
     
-    except Exception as e:
-        logger.error(f"Error scraping Glassdoor: {e}")
-        return []
+    return job_list
 
-# 🏗️ Function to Get Job Data from LinkedIn
-def scrape_linkedin(driver, job_title, location, filters=None):
-    logger.info(f"Scraping LinkedIn for {job_title} in {location}")
-    
-    # Build URL with filters
-    url = f"https://www.linkedin.com/jobs/search/?keywords={job_title.replace(' ', '%20')}"
+# 🏗️ Function to Get Job Data from Glassdoor
+def scrape_glassdoor(driver, job_title, location, filters=None, cache=None, max_pages=1, breaker=None, checkpoint=None):
+    # Glassdoor can be slower to load
+    return scrape_pages("Glassdoor", driver, build_glassdoor_url, parse_glassdoor_page, job_title, location,
+                        filters, cache, max_pages, delay=(4, 7), breaker=breaker,
+                        prepare=prepare_glassdoor_page, checkpoint=checkpoint)
+
+# 🔗 Build LinkedIn search URL with filters
+def build_linkedin_url(job_title, location, filters=None, page_num=0):
+    url = f"{SOURCE_BASE_URLS['LinkedIn']}/jobs/search/?keywords={job_title.replace(' ', '%20')}"
     
     # Add location
     if location:
@@ -369,105 +602,118 @@ def scrape_linkedin(driver, job_title, location, filters=None):
         if filters.get('remote'):
             url += "&f_WT=2"
     
-    try:
-        driver.get(url)
-        time.sleep(random.uniform(3, 6))
-        
-        job_list = []
-        
-        # Try different selectors to find job listings
-        possible_job_selectors = [
-            "base-search-card__info",
-            "job-search-card",
-            "jobs-search-results__list-item"
-        ]
-        
-        jobs = []
-        for selector in possible_job_selectors:
-            jobs = driver.find_elements(By.CLASS_NAME, selector)
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on LinkedIn using selector: {selector}")
-                break
-        
-        if not jobs:
-            # Try a generic approach
-            jobs = driver.find_elements(By.CSS_SELECTOR, "li.jobs-search-results__list-item")
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on LinkedIn using generic selector")
-            else:
-                logger.warning("No jobs found on LinkedIn. The page structure might have changed.")
-        
-        for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
-            try:
-                # Try multiple possible selectors for each element
-                title = None
-                for selector in ["base-search-card__title", "job-card-list__title", "job-title"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        title = elements[0].text
-                        break
-                
-                company = None
-                for selector in ["base-search-card__subtitle", "job-card-container__company-name", "job-card-container__primary-description"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        company = elements[0].text
-                        break
-                
-                # LinkedIn doesn't always show salary in the listings
-                salary = "N/A"
-                for selector in ["job-search-card__salary-info", "salary-badge"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        salary = elements[0].text
-                        break
-                
-                link = None
-                elements = job.find_elements(By.TAG_NAME, "a")
+    # LinkedIn pages by result offset, 25 per page
+    if page_num:
+        url += f"&start={page_num * 25}"
+    
+    return url
+
+# 🧩 Extract job cards from a loaded LinkedIn results page
+def parse_linkedin_page(page, filters=None, stats=None):
+    job_list = []
+    stats = stats if stats is not None else {}
+    
+    # Try different selectors to find job listings
+    possible_job_selectors = [
+        "base-search-card__info",
+        "job-search-card",
+        "jobs-search-results__list-item"
+    ]
+    
+    jobs = []
+    for selector in possible_job_selectors:
+        jobs = page.find_elements(By.CLASS_NAME, selector)
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on LinkedIn using selector: {selector}")
+            break
+    
+    if not jobs:
+        # Try a generic approach
+        jobs = page.find_elements(By.CSS_SELECTOR, "li.jobs-search-results__list-item")
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on LinkedIn using generic selector")
+        else:
+            logger.warning("No jobs found on LinkedIn. The page structure might have changed.")
+    
+    stats['cards'] = stats.get('cards', 0) + len(jobs[:20])
+    for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
+        try:
+            # Try multiple possible selectors for each element
+            title = None
+            for selector in ["base-search-card__title", "job-card-list__title", "job-title"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
                 if elements:
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and "/jobs/view/" in href:
-                            link = href
-                            break
-                
-                posted_date = "N/A"
-                elements = job.find_elements(By.TAG_NAME, "time")
+                    title = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'title', title):
+                continue
+            
+            company = None
+            for selector in ["base-search-card__subtitle", "job-card-container__company-name", "job-card-container__primary-description"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
                 if elements:
-                    posted_date = elements[0].text
-                    # Try to get datetime attribute if available
-                    datetime_attr = elements[0].get_attribute("datetime")
-                    if datetime_attr:
-                        posted_date = datetime_attr
-                
-                # LinkedIn doesn't show job summary in the listings
-                summary = "N/A"
-                for selector in ["job-search-card__location", "location"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        summary = f"Location: {elements[0].text}"
-                        break
-                
-                if title and company:
-                    job_list.append(["LinkedIn", title, company, salary, link or "N/A", posted_date, summary])
+                    company = elements[0].text
+                    break
             
-            except Exception as e:
-                logger.warning(f"Error parsing LinkedIn job: {e}")
+            if skip_card(stats, filters, 'company', company):
                 continue
+            
+            # LinkedIn doesn't always show salary in the listings
+            salary = "N/A"
+            for selector in ["job-search-card__salary-info", "salary-badge"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    salary = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'salary', salary):
+                continue
+            
+            link = None
+            elements = job.find_elements(By.TAG_NAME, "a")
+            if elements:
+                for element in elements:
+                    href = element.get_attribute("href")
+                    if href and "/jobs/view/" in href:
+                        link = href
+                        break
+            
+            posted_date = "N/A"
+            elements = job.find_elements(By.TAG_NAME, "time")
+            if elements:
+                posted_date = elements[0].text
+                # Try to get datetime attribute if available
+                datetime_attr = elements[0].get_attribute("datetime")
+                if datetime_attr:
+                    posted_date = datetime_attr
+            
+            # LinkedIn doesn't show job summary in the listings
+            summary = "N/A"
+            for selector in ["job-search-card__location", "location"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    summary = f"Location: {elements[0].text}"
+                    break
+            
+            stats['extracted'] = stats.get('extracted', 0) + 1
+            if title and company:
+                job_list.append(["LinkedIn", title, company, salary, link or "N/A", posted_date, summary])
         
-        logger.info(f"Successfully scraped {len(job_list)} jobs from LinkedIn")
-        return job_list
+        except Exception as e:
+            logger.warning(f"Error parsing LinkedIn job: {e}")
+            continue
     
-    except Exception as e:
-        logger.error(f"Error scraping LinkedIn: {e}")
-        return []
+    return job_list
 
-# 🏗️ Function to Get Job Data from ZipRecruiter
-def scrape_ziprecruiter(driver, job_title, location, filters=None):
-    logger.info(f"Scraping ZipRecruiter for {job_title} in {location}")
-    
-    # Build URL with filters
-    url = f"https://www.ziprecruiter.com/jobs-search?search={job_title.replace(' ', '+')}"
+# 🏗️ Function to Get Job Data from LinkedIn
+def scrape_linkedin(driver, job_title, location, filters=None, cache=None, max_pages=1, breaker=None, checkpoint=None):
+    return scrape_pages("LinkedIn", driver, build_linkedin_url, parse_linkedin_page, job_title, location,
+                        filters, cache, max_pages, delay=(3, 6), breaker=breaker, checkpoint=checkpoint)
+
+# 🔗 Build ZipRecruiter search URL with filters
+def build_ziprecruiter_url(job_title, location, filters=None, page_num=0):
+    url = f"{SOURCE_BASE_URLS['ZipRecruiter']}/jobs-search?search={job_title.replace(' ', '+')}"
     
     # Add location
     if location:
@@ -492,94 +738,306 @@ def scrape_ziprecruiter(driver, job_title, location, filters=None):
         if filters.get('remote'):
             url += "&remote=true"
     
-    try:
-        driver.get(url)
-        time.sleep(random.uniform(3, 6))
-        
-        job_list = []
-        
-        # Try different selectors to find job listings
-        possible_job_selectors = [
-            "job_result",
-            "job_content",
-            "jobList-item"
-        ]
-        
-        jobs = []
-        for selector in possible_job_selectors:
-            jobs = driver.find_elements(By.CLASS_NAME, selector)
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on ZipRecruiter using selector: {selector}")
-                break
-        
-        if not jobs:
-            # Try a generic approach
-            jobs = driver.find_elements(By.CSS_SELECTOR, "article[data-job-id]")
-            if jobs:
-                logger.info(f"Found {len(jobs)} jobs on ZipRecruiter using generic selector")
-            else:
-                logger.warning("No jobs found on ZipRecruiter. The page structure might have changed.")
-        
-        for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
-            try:
-                # Try multiple possible selectors for each element
-                title = None
-                for selector in ["job_title", "title", "jobTitle"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        title = elements[0].text
-                        break
-                
-                company = None
-                for selector in ["hiring_company", "company", "companyName"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        company = elements[0].text
-                        break
-                
-                salary = "N/A"
-                for selector in ["salary_estimate", "salary", "jobSalary"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        salary = elements[0].text
-                        break
-                
-                link = None
-                elements = job.find_elements(By.TAG_NAME, "a")
+    # ZipRecruiter uses 1-based page numbers
+    if page_num:
+        url += f"&page={page_num + 1}"
+    
+    return url
+
+# 🧩 Extract job cards from a loaded ZipRecruiter results page
+def parse_ziprecruiter_page(page, filters=None, stats=None):
+    job_list = []
+    stats = stats if stats is not None else {}
+    
+    # Try different selectors to find job listings
+    possible_job_selectors = [
+        "job_result",
+        "job_content",
+        "jobList-item"
+    ]
+    
+    jobs = []
+    for selector in possible_job_selectors:
+        jobs = page.find_elements(By.CLASS_NAME, selector)
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on ZipRecruiter using selector: {selector}")
+            break
+    
+    if not jobs:
+        # Try a generic approach
+        jobs = page.find_elements(By.CSS_SELECTOR, "article[data-job-id]")
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs on ZipRecruiter using generic selector")
+        else:
+            logger.warning("No jobs found on ZipRecruiter. The page structure might have changed.")
+    
+    stats['cards'] = stats.get('cards', 0) + len(jobs[:20])
+    for job in jobs[:20]:  # Limit to first 20 jobs for efficiency
+        try:
+            # Try multiple possible selectors for each element
+            title = None
+            for selector in ["job_title", "title", "jobTitle"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
                 if elements:
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and "/jobs/" in href:
-                            link = href
-                            break
-                
-                posted_date = "N/A"
-                for selector in ["job_posted", "posted", "datePosted"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        posted_date = elements[0].text
-                        break
-                
-                summary = "N/A"
-                for selector in ["job_snippet", "snippet", "jobSnippet"]:
-                    elements = job.find_elements(By.CLASS_NAME, selector)
-                    if elements:
-                        summary = elements[0].text
-                        break
-                
-                if title and company:
-                    job_list.append(["ZipRecruiter", title, company, salary, link or "N/A", posted_date, summary])
+                    title = elements[0].text
+                    break
             
-            except Exception as e:
-                logger.warning(f"Error parsing ZipRecruiter job: {e}")
+            if skip_card(stats, filters, 'title', title):
                 continue
+            
+            company = None
+            for selector in ["hiring_company", "company", "companyName"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    company = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'company', company):
+                continue
+            
+            salary = "N/A"
+            for selector in ["salary_estimate", "salary", "jobSalary"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    salary = elements[0].text
+                    break
+            
+            if skip_card(stats, filters, 'salary', salary):
+                continue
+            
+            link = None
+            elements = job.find_elements(By.TAG_NAME, "a")
+            if elements:
+                for element in elements:
+                    href = element.get_attribute("href")
+                    if href and "/jobs/" in href:
+                        link = href
+                        break
+            
+            posted_date = "N/A"
+            for selector in ["job_posted", "posted", "datePosted"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    posted_date = elements[0].text
+                    break
+            
+            summary = "N/A"
+            for selector in ["job_snippet", "snippet", "jobSnippet"]:
+                elements = job.find_elements(By.CLASS_NAME, selector)
+                if elements:
+                    summary = elements[0].text
+                    break
+            
+            stats['extracted'] = stats.get('extracted', 0) + 1
+            if title and company:
+                job_list.append(["ZipRecruiter", title, company, salary, link or "N/A", posted_date, summary])
         
-        logger.info(f"Successfully scraped {len(job_list)} jobs from ZipRecruiter")
-        return job_list
+        except Exception as e:
+            logger.warning(f"Error parsing ZipRecruiter job: {e}")
+            continue
     
-    except Exception as e:
-        logger.error(f"Error scraping ZipRecruiter: {e}")
-        return []
+    return job_list
+
+# 🏗️ Function to Get Job Data from ZipRecruiter
+def scrape_ziprecruiter(driver, job_title, location, filters=None, cache=None, max_pages=1, breaker=None, checkpoint=None):
+    return scrape_pages("ZipRecruiter", driver, build_ziprecruiter_url, parse_ziprecruiter_page, job_title, location,
+                        filters, cache, max_pages, delay=(3, 6), breaker=breaker, checkpoint=checkpoint)
+
+SOURCE_SCRAPE_FUNCTIONS = {
+    'Indeed': scrape_indeed,
+    'Glassdoor': scrape_glassdoor,
+    'LinkedIn': scrape_linkedin,
+    'ZipRecruiter': scrape_ziprecruiter
+}
+
+# Per-page building blocks of each scraper, for schedulers that drive pages themselves
+SOURCE_PAGE_HANDLERS = {
+    'Indeed': {'build_url': build_indeed_url, 'parse_page': parse_indeed_page, 'delay': (3, 6)},
+    'Glassdoor': {'build_url': build_glassdoor_url, 'parse_page': parse_glassdoor_page, 'delay': (4, 7),
+                  'prepare': prepare_glassdoor_page},
+    'LinkedIn': {'build_url': build_linkedin_url, 'parse_page': parse_linkedin_page, 'delay': (3, 6)},
+    'ZipRecruiter': {'build_url': build_ziprecruiter_url, 'parse_page': parse_ziprecruiter_page, 'delay': (3, 6)}
+}
+
+# Runs in a parse worker process: the source's usual card extraction over a snapshot of the page
+def parse_page_source(source, html, url, filters=None):
+    page_stats = {}
+    page_jobs = SOURCE_PAGE_HANDLERS[source]['parse_page'](SnapshotPage(html, url), filters, page_stats)
+    return page_jobs, page_stats
+
+# 🏭 Scrape every (query, source) pair with card extraction offloaded to a
+# process pool. The browser only loads pages and snapshots their HTML; each
+# snapshot is parsed in a worker while the browser goes on to the next
+# pair's page. A pair's next page is fetched once its previous page has been
+# parsed, so pagination stops exactly where the sequential scraper would.
+# A source that hasn't yet returned a good page gets one page at a time, so
+# the circuit breaker sees each failure before the next request is allowed.
+# Returns {(job_title, source): jobs} in page order.
+def scrape_with_parse_pool(driver, job_titles, sources, location, filters=None, cache=None, max_pages=1,
+                           breaker=None, workers=None, checkpoint=None):
+    results = {(job_title, source): [] for job_title in job_titles for source in sources}
+    waiting = deque((job_title, source) for job_title in job_titles for source in sources)
+    next_pages = deque()
+    in_flight = []
+    proven = set()
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Load one page and hand its snapshot to the pool
+        def fetch(job_title, source, page_num):
+            handlers = SOURCE_PAGE_HANDLERS[source]
+            if page_num == 0:
+                logger.info(f"Scraping {source} for {job_title} in {location}")
+            resumed = resume_listing_page(checkpoint, job_title, source, page_num)
+            if resumed is not None:
+                page_jobs, more_pages = resumed
+                results[(job_title, source)].extend(page_jobs)
+                if more_pages:
+                    next_pages.append((job_title, source, page_num + 1))
+                return
+            if breaker and not breaker.allow_request(source):
+                logger.info(f"Skipping {source}: circuit open")
+                return
+            url = handlers['build_url'](job_title, location, filters, page_num)
+            try:
+                fetched = fetch_page_source(driver, url, filters, cache, handlers['delay'], handlers.get('prepare'))
+            except Exception as e:
+                logger.error(f"Error scraping {source}: {e}")
+                if breaker:
+                    breaker.record_failure(source, f"error: {e}")
+                return
+            if fetched is None:
+                return
+            html, fetched_at = fetched
+            future = pool.submit(parse_page_source, source, html, url, filters)
+            in_flight.append((job_title, source, page_num, future, html, fetched_at))
+        
+        # Wait for a parse and report it to the breaker, the checkpoint and the pair's pagination
+        def settle(entry):
+            in_flight.remove(entry)
+            job_title, source, page_num, future, html, fetched_at = entry
+            try:
+                page_jobs, page_stats = future.result()
+                page_jobs, more_pages = finish_listing_page(source, page_jobs, page_stats, page_num, fetched_at,
+                                                            lambda: html, filters, max_pages, breaker, checkpoint,
+                                                            job_title)
+            except Exception as e:
+                logger.error(f"Error parsing {source} page {page_num + 1}: {e}")
+                if breaker:
+                    breaker.record_failure(source, f"error: {e}")
+                return
+            if page_stats.get('cards'):
+                proven.add(source)
+            results[(job_title, source)].extend(page_jobs)
+            if more_pages:
+                next_pages.append((job_title, source, page_num + 1))
+        
+        while waiting or next_pages or in_flight:
+            for entry in [entry for entry in in_flight if entry[3].done()]:
+                settle(entry)
+            
+            if next_pages:
+                fetch(*next_pages.popleft())
+            elif waiting:
+                busy = {entry[1] for entry in in_flight}
+                startable = next((pair for pair in waiting if pair[1] in proven or pair[1] not in busy), None)
+                if startable is None:
+                    # Every waiting pair is on an untested source whose first page is still parsing
+                    settle(in_flight[0])
+                    continue
+                waiting.remove(startable)
+                fetch(*startable, 0)
+            elif in_flight:
+                # The opening pass may already have settled the last parse
+                settle(in_flight[0])
+    
+    return results
+
+# 🗂️ Scrape every (query, source) pair concurrently in the tabs of one browser.
+# Each pair's pages are still fetched in order (page n+1 is only queued once
+# page n had results), but up to `tab_count` pages from different pairs load
+# at the same time. Pages are handed to the scheduler only when a tab frees
+# up, so the circuit breaker is asked at that moment, and a source that
+# hasn't yet returned a good page gets one tab at a time.
+# Returns {(job_title, source): jobs} in page order.
+def scrape_in_tabs(driver, job_titles, sources, location, filters=None, cache=None, max_pages=1,
+                   breaker=None, tab_count=4, checkpoint=None):
+    results = {(job_title, source): [] for job_title in job_titles for source in sources}
+    waiting = deque((job_title, source) for job_title in job_titles for source in sources)
+    next_pages = deque()
+    loading = {source: 0 for source in sources}
+    proven = set()
+    
+    # Tasks for page `page_num` of one pair; cache hits are handled inline and go straight to the next page
+    def page_tasks(job_title, source, page_num):
+        handlers = SOURCE_PAGE_HANDLERS[source]
+        if page_num == 0:
+            logger.info(f"Scraping {source} for {job_title} in {location}")
+        resumed = resume_listing_page(checkpoint, job_title, source, page_num)
+        if resumed is not None:
+            page_jobs, more_pages = resumed
+            results[(job_title, source)].extend(page_jobs)
+            return page_tasks(job_title, source, page_num + 1) if more_pages else []
+        if breaker and not breaker.allow_request(source):
+            logger.info(f"Skipping {source}: circuit open")
+            return []
+        url = handlers['build_url'](job_title, location, filters, page_num)
+        
+        def on_ready(page):
+            if not getattr(page, 'is_snapshot', False):
+                loading[source] -= 1
+            try:
+                if not getattr(page, 'is_snapshot', False):
+                    if handlers.get('prepare'):
+                        handlers['prepare'](page)
+                    if cache:
+                        cache.put(url, page.page_source, filters)
+                page_jobs, more_pages = harvest_listing_page(source, page, handlers['parse_page'], page_num,
+                                                             filters, max_pages, breaker, checkpoint, job_title)
+            except Exception as e:
+                logger.error(f"Error scraping {source}: {e}")
+                if breaker:
+                    breaker.record_failure(source, f"error: {e}")
+                return []
+            if page_jobs or more_pages:
+                proven.add(source)
+            results[(job_title, source)].extend(page_jobs)
+            if more_pages:
+                # Cache hits are finished on the spot; loaded pages queue the next one for a free tab
+                if getattr(page, 'is_snapshot', False):
+                    return page_tasks(job_title, source, page_num + 1)
+                next_pages.append((job_title, source, page_num + 1))
+            return []
+        
+        if cache:
+            cached = cache.get_with_time(url, filters)
+            if cached is not None:
+                logger.info(f"Page cache hit for {url}")
+                html, stored_at = cached
+                return on_ready(SnapshotPage(html, url, fetched_at=stored_at))
+        
+        dwell = random.uniform(*handlers['delay']) * DELAY_SCALE
+        loading[source] += 1
+        return [TabTask(url, on_ready, dwell, label=f"{source} page {page_num + 1} for {job_title}")]
+    
+    # Called by the scheduler whenever a tab is free; None when nothing can start right now
+    def next_task():
+        while next_pages or waiting:
+            if next_pages:
+                tasks = page_tasks(*next_pages.popleft())
+            else:
+                startable = next((pair for pair in waiting if pair[1] in proven or not loading[pair[1]]), None)
+                if startable is None:
+                    return None
+                waiting.remove(startable)
+                tasks = page_tasks(*startable, 0)
+            if tasks:
+                return tasks[0]
+        return None
+    
+    scheduler = TabScheduler(driver, tab_count)
+    scheduler.run(next_task=next_task)
+    logger.info(f"Loaded {scheduler.loads} pages in {scheduler.tab_count} tabs ({scheduler.timeouts} timed out)")
+    return results
 
 # 📌 Save Data to Google Sheets
 def save_to_google_sheets(data, filters=None):
@@ -658,50 +1116,94 @@ def parse_salary(salary_str):
     
     return None
 
+# ✔️ Check a single job against the post-scrape criteria
+def job_matches(job, criteria):
+    source, title, company, salary, link, posted_date, summary = job
+    
+    # Filter by keywords in title
+    if criteria.get('keywords') and all(keyword.lower() not in title.lower() for keyword in criteria['keywords']):
+        return False
+    
+    # Filter by keywords in company
+    if criteria.get('companies') and all(company_name.lower() not in company.lower() for company_name in criteria['companies']):
+        return False
+    
+    # Filter by minimum salary
+    if criteria.get('min_salary'):
+        salary_value = parse_salary(salary)
+        if not salary_value or salary_value < criteria['min_salary']:
+            return False
+    
+    # Filter by source
+    if criteria.get('sources') and source not in criteria['sources']:
+        return False
+    
+    # Filter by freshness (postings without a readable date are kept)
+    if criteria.get('max_days_old'):
+        age = age_in_days(posted_date)
+        if age is not None and age > criteria['max_days_old']:
+            return False
+    
+    return True
+
 # 🔍 Function to filter jobs based on criteria
 def filter_jobs(jobs, criteria):
     if not criteria:
         return jobs
     
-    filtered_jobs = []
-    for job in jobs:
-        source, title, company, salary, link, posted_date, summary = job
-        
-        # Filter by keywords in title
-        if criteria.get('keywords') and all(keyword.lower() not in title.lower() for keyword in criteria['keywords']):
-            continue
-        
-        # Filter by keywords in company
-        if criteria.get('companies') and all(company_name.lower() not in company.lower() for company_name in criteria['companies']):
-            continue
-        
-        # Filter by minimum salary
-        if criteria.get('min_salary'):
-            salary_value = parse_salary(salary)
-            if not salary_value or salary_value < criteria['min_salary']:
-                continue
-        
-        # Filter by source
-        if criteria.get('sources') and source not in criteria['sources']:
-            continue
-        
-        # Filter by freshness
-        if criteria.get('max_days_old') and "day" in posted_date:
-            try:
-                days = int(re.search(r'(\d+)', posted_date).group(1))
-                if days > criteria['max_days_old']:
-                    continue
-            except:
-                pass
-        
-        filtered_jobs.append(job)
+    # Spilled runs are filtered as a stream into another on-disk spool
+    if isinstance(jobs, SpillingJobStore):
+        return jobs.filtered(lambda job: job_matches(job, criteria))
+    
+    return [job for job in jobs if job_matches(job, criteria)]
+
+# 💾 Save jobs to a CSV file
+def save_to_csv(jobs, filename):
+    if isinstance(jobs, list):
+        df = pd.DataFrame(jobs, columns=HEADER)
+        df.to_csv(filename, index=False)
+        return
+    
+    # Spilled results are streamed row by row instead of building a DataFrame
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for job in jobs:
+            writer.writerow(job)
+
+# 🔎 Search the local index of jobs from past runs (`job_scraper.py query ...`)
+def query_index(argv):
+    parser = argparse.ArgumentParser(prog='job_scraper.py query', description='Search jobs collected by past runs')
+    parser.add_argument('terms', nargs='*', help='Keywords; prefix with title:, company: or summary: to restrict the field, end with * to match a prefix')
+    parser.add_argument('--sources', type=str, nargs='+', choices=['Indeed', 'Glassdoor', 'LinkedIn', 'ZipRecruiter'], help='Only jobs from these sources')
+    parser.add_argument('--days', type=int, help='Only jobs posted in the last N days (first seen, if the posting date is unknown)')
+    parser.add_argument('--min_salary', type=int, help='Minimum salary')
+    parser.add_argument('--limit', type=int, default=50, help='Maximum number of jobs to show')
+    parser.add_argument('--index_db', type=str, default='job_index.db', help='Path of the job index')
+    args = parser.parse_args(argv)
     
-    return filtered_jobs
+    index = JobIndex(args.index_db)
+    try:
+        start = time.perf_counter()
+        rows = index.search(' '.join(args.terms), args.sources, args.days, args.min_salary, args.limit)
+        elapsed = time.perf_counter() - start
+        
+        for row in rows:
+            seen = datetime.fromtimestamp(row['posted_at'] or row['first_seen']).strftime("%Y-%m-%d")
+            print(f"{seen}  {row['source']:<12}  {row['title']} @ {row['company']}  [{row['salary']}]  {row['link']}")
+        print(f"\n🔎 {len(rows)} jobs shown ({elapsed * 1000:.1f} ms, {index.count()} jobs indexed)")
+    finally:
+        index.close()
 
 # 🚀 Main Execution
 def main():
+    # Querying the local index needs no browser or search filters
+    if len(sys.argv) > 1 and sys.argv[1] == 'query':
+        query_index(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(description='Job Scraper with Filters')
-    parser.add_argument('--job_title', type=str, help='Job title to search for')
+    parser.add_argument('--job_title', type=str, action='append', help='Job title to search for; repeat (--job_title a --job_title b) to run several queries')
     parser.add_argument('--location', type=str, help='Location to search in')
     parser.add_argument('--date_posted', type=str, choices=['24h', '3d', '7d', '14d', '30d'], help='Filter by date posted')
     parser.add_argument('--job_type', type=str, choices=['full_time', 'part_time', 'contract', 'temporary', 'internship'], help='Filter by job type')
@@ -712,8 +1214,41 @@ def main():
     parser.add_argument('--keywords', type=str, nargs='+', help='Keywords that must appear in job title')
     parser.add_argument('--companies', type=str, nargs='+', help='Companies to filter by')
     parser.add_argument('--max_days_old', type=int, help='Maximum age of job posting in days')
+    parser.add_argument('--cache', action='store_true', help='Cache fetched listing pages on disk')
+    parser.add_argument('--cache_dir', type=str, default='.job_cache', help='Directory for the page cache')
+    parser.add_argument('--cache_ttl', type=float, default=24, help='Hours before a cached page is refetched')
+    parser.add_argument('--cache_max_mb', type=int, default=200, help='Maximum size of the page cache in MB')
+    parser.add_argument('--replay', action='store_true', help='Re-run extraction from cached pages only (no browser, no network)')
+    parser.add_argument('--pages', type=int, default=1, help='Maximum result pages to fetch per source')
+    parser.add_argument('--base_url', type=str, help='Send every source to this host instead (e.g. a local mock_board.py)')
+    parser.add_argument('--no_delay', action='store_true', help='Skip the randomized pause after each page load')
+    parser.add_argument('--rank', action='store_true', help='Order results by relevance to the job title and keywords')
+    parser.add_argument('--top', type=int, help='Keep only the K most relevant jobs (implies --rank)')
+    parser.add_argument('--index_db', type=str, default='job_index.db', help='Local index of past runs, searched with `query`; jobs dropped by --keywords, --companies or --salary_min are not indexed')
+    parser.add_argument('--no_index', action='store_true', help='Do not add this run to the local index (replay runs are never indexed)')
+    parser.add_argument('--breaker_threshold', type=int, default=2, help='Consecutive empty/blocked pages before a source is skipped')
+    parser.add_argument('--breaker_cooldown', type=float, default=60, help='Seconds a tripped source is skipped (doubles on each repeat trip)')
+    parser.add_argument('--memory_budget_mb', type=float, help='Spill collected jobs to disk beyond this many MB and filter/export them as a stream (needs --top with --rank)')
+    parser.add_argument('--tabs', type=int, default=1, help='Load this many result pages at once in tabs of a single browser (not with --memory_budget_mb)')
+    parser.add_argument('--checkpoint', type=str, default='.job_checkpoint.jsonl', help='File recording finished pages so an interrupted run can be resumed (deleted once the run completes)')
+    parser.add_argument('--resume', action='store_true', help='Skip pages already finished by the interrupted run in --checkpoint')
+    parser.add_argument('--parse_workers', type=int, help='Parse page snapshots in this many worker processes while the browser keeps loading (0 = one per core; not with --memory_budget_mb)')
     
     args = parser.parse_args()
+    if args.tabs > 1 and args.parse_workers is not None:
+        logger.error("--tabs and --parse_workers cannot be combined.")
+        return
+    if args.memory_budget_mb and args.rank and not args.top:
+        # A full ranking has to hold every job in memory, which the budget is there to prevent
+        logger.error("--rank with --memory_budget_mb needs --top K.")
+        return
+    if args.memory_budget_mb and args.tabs > 1:
+        # Concurrent scraping holds every pair's jobs until all pages are in
+        logger.error("--tabs cannot be combined with --memory_budget_mb.")
+        return
+    if args.memory_budget_mb and args.parse_workers is not None:
+        logger.error("--parse_workers cannot be combined with --memory_budget_mb.")
+        return
     
 # Interactive input mode if no command line arguments
     if len(sys.argv) == 1:
@@ -724,6 +1259,7 @@ def main():
         if not job_title:
             logger.error("Job title is required.")
             return
+        job_titles = [job_title]
         
         location = input("📍 Enter location (leave blank for any): ").strip()
         
@@ -802,8 +1338,8 @@ def main():
             filters['max_days_old'] = int(max_days)
     else:
         # Use command line arguments
-        job_title = args.job_title
-        if not job_title:
+        job_titles = [t.strip() for t in args.job_title or [] if t.strip()]
+        if not job_titles:
             logger.error("Job title is required.")
             return
         
@@ -824,53 +1360,126 @@ def main():
         filters = {k: v for k, v in filters.items() if v is not None}
     
     # Store search parameters
-    filters['job_title'] = job_title
+    filters['job_title'] = ', '.join(job_titles)
     filters['location'] = location
     
     # Log search configuration
     logger.info(f"Starting job search with filters: {filters}")
-    print(f"\n🔍 Scraping job listings for '{job_title}' in '{location or 'any location'}'...")
+    print(f"\n🔍 Scraping job listings for '{filters['job_title']}' in '{location or 'any location'}'...")
     
-    # Setup WebDriver
-    try:
-        driver = setup_driver()
-    except Exception as e:
-        logger.error(f"Failed to set up WebDriver: {e}")
-        print("❌ Error: Could not initialize web browser. Check your Chrome installation.")
-        return
+    if args.base_url:
+        for source in SOURCE_BASE_URLS:
+            SOURCE_BASE_URLS[source] = args.base_url.rstrip('/')
+    if args.no_delay:
+        global DELAY_SCALE
+        DELAY_SCALE = 0
+    if args.replay:
+        # No network in replay: Glassdoor location IDs come from the cache only
+        GLASSDOOR_LOCATIONS.offline = True
+    
+    # Page cache: replay mode reads whatever is cached, regardless of age
+    cache = None
+    if args.cache or args.replay:
+        cache = PageCache(
+            args.cache_dir,
+            ttl=None if args.replay else args.cache_ttl * 3600,
+            max_bytes=args.cache_max_mb * 1024 * 1024
+        )
     
-    all_jobs = []
+    # Setup WebDriver (not needed when replaying cached pages)
+    driver = None
+    if not args.replay:
+        try:
+            driver = setup_driver()
+        except Exception as e:
+            logger.error(f"Failed to set up WebDriver: {e}")
+            print("❌ Error: Could not initialize web browser. Check your Chrome installation.")
+            return
     
-    # Scrape each requested source
+    # Past the memory budget, collected jobs live in sorted on-disk runs
+    if args.memory_budget_mb:
+        all_jobs = SpillingJobStore(int(args.memory_budget_mb * 1024 * 1024))
+    else:
+        all_jobs = []
+    
+    # Relevance statistics are collected as each source's jobs come in
+    ranker = None
+    if args.rank or args.top:
+        ranker = RelevanceRanker(' '.join(job_titles), filters.get('keywords'))
+    
+    # Sources that keep failing are skipped for a while across queries
+    breaker = CircuitBreaker(args.breaker_threshold, args.breaker_cooldown)
+    
+    # Scrape each requested source for every query
     sources = filters.get('sources', ['Indeed', 'Glassdoor', 'LinkedIn', 'ZipRecruiter'])
     
+    # Finished pages are recorded as they complete; --resume picks up where a killed or crashed
+    # run stopped (retrying pages that failed) and a run without it starts the file over.
+    # Replay fetches nothing worth resuming, so it leaves an interrupted run's checkpoint alone.
+    checkpoint = None
+    if not args.replay:
+        run = {'job_titles': job_titles, 'location': location, 'filters': filters, 'pages': args.pages,
+               'base_urls': SOURCE_BASE_URLS}
+        checkpoint = Checkpoint(args.checkpoint, run, resume=args.resume)
+    scraped = False
+    
     try:
-        if 'Indeed' in sources:
-            indeed_jobs = scrape_indeed(driver, job_title, location, filters)
-            all_jobs.extend(indeed_jobs)
-            print(f"✅ Found {len(indeed_jobs)} jobs on Indeed")
-        
-        if 'Glassdoor' in sources:
-            glassdoor_jobs = scrape_glassdoor(driver, job_title, location, filters)
-            all_jobs.extend(glassdoor_jobs)
-            print(f"✅ Found {len(glassdoor_jobs)} jobs on Glassdoor")
-        
-        if 'LinkedIn' in sources:
-            linkedin_jobs = scrape_linkedin(driver, job_title, location, filters)
-            all_jobs.extend(linkedin_jobs)
-            print(f"✅ Found {len(linkedin_jobs)} jobs on LinkedIn")
-        
-        if 'ZipRecruiter' in sources:
-            ziprecruiter_jobs = scrape_ziprecruiter(driver, job_title, location, filters)
-            all_jobs.extend(ziprecruiter_jobs)
-            print(f"✅ Found {len(ziprecruiter_jobs)} jobs on ZipRecruiter")
+        # Several tabs in one browser, or parsing in worker processes; otherwise one page at a time
+        scheduled_results = None
+        ordered_sources = [source for source in SOURCE_SCRAPE_FUNCTIONS if source in sources]
+        if args.parse_workers is not None:
+            scheduled_results = scrape_with_parse_pool(driver, job_titles, ordered_sources, location, filters, cache,
+                                                 args.pages, breaker, args.parse_workers or None, checkpoint)
+        elif driver and args.tabs > 1:
+            scheduled_results = scrape_in_tabs(driver, job_titles, ordered_sources, location, filters, cache,
+                                         args.pages, breaker, args.tabs, checkpoint)
+        
+        for job_title in job_titles:
+            for source, scrape in SOURCE_SCRAPE_FUNCTIONS.items():
+                if source in sources:
+                    if scheduled_results is not None:
+                        source_jobs = scheduled_results[(job_title, source)]
+                    else:
+                        source_jobs = scrape(driver, job_title, location, filters, cache, args.pages, breaker, checkpoint)
+                    all_jobs.extend(source_jobs)
+                    if ranker:
+                        ranker.add_many(source_jobs)
+                    suffix = f" for '{job_title}'" if len(job_titles) > 1 else ""
+                    print(f"✅ Found {len(source_jobs)} jobs on {source}{suffix}")
+        scraped = True
         
     except Exception as e:
         logger.error(f"Error during scraping: {e}")
         print(f"❌ Error occurred during scraping: {e}")
     finally:
         # Close the WebDriver
-        driver.quit()
+        if driver:
+            driver.quit()
+        # Save the cache index even if the run is interrupted
+        if cache:
+            cache.flush()
+    
+    # The same posting can turn up on several pages and queries; the spilling store dedupes as it streams
+    if isinstance(all_jobs, list):
+        all_jobs = unique_jobs(all_jobs)
+    
+    if cache:
+        logger.info(f"Page cache stats: {cache.stats()}")
+    if checkpoint and checkpoint.resumed:
+        logger.info(f"Reused {checkpoint.resumed} pages from checkpoint {args.checkpoint}")
+    
+    # Archive every extracted job for later queries. The --sources and --max_days_old criteria
+    # only apply afterwards, but cards failing --keywords, --companies or --salary_min are
+    # skipped during extraction and never reach the index.
+    # Replay only re-extracts old pages, so it would refresh last_seen for postings that may be long gone
+    if all_jobs and not args.no_index and not args.replay:
+        try:
+            index = JobIndex(args.index_db)
+            added = index.add_jobs(all_jobs, parse_salary)
+            logger.info(f"Indexed {added} new jobs ({index.count()} total) in {args.index_db}")
+            index.close()
+        except Exception as e:
+            logger.error(f"Error updating job index: {e}")
     
     # Apply post-scraping filters
     post_filters = {
@@ -884,6 +1493,10 @@ def main():
     
     filtered_jobs = filter_jobs(all_jobs, post_filters)
     
+    if ranker:
+        filtered_jobs = ranker.top_k(filtered_jobs, args.top)
+        logger.info(f"Ranked results by relevance to: {' '.join(ranker.query_terms)}")
+    
     # Generate report
     if filtered_jobs:
         # Save to Google Sheets
@@ -896,15 +1509,18 @@ def main():
             
             # Fallback to CSV
             try:
-                df = pd.DataFrame(filtered_jobs, columns=["Source", "Job Title", "Company", "Salary", "Job Link", "Date Posted", "Summary"])
                 filename = f"job_listings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                df.to_csv(filename, index=False)
+                save_to_csv(filtered_jobs, filename)
                 print(f"✅ Job data saved to {filename}")
             except Exception as csv_error:
                 logger.error(f"Error saving to CSV: {csv_error}")
                 print("❌ Could not save job data.")
     else:
         print("❌ No matching jobs found. Try broadening your search criteria.")
+    
+    # Results are out, so a later --resume must not hand back this run's jobs; a failed scrape keeps its pages
+    if checkpoint and scraped:
+        checkpoint.finish()
         
     # Print statistics
     print("\n📊 Job Search Statistics:")
@@ -921,9 +1537,24 @@ def main():
         for source, count in source_counts.items():
             print(f"- {source}: {count}")
     
+    print("\nSource health:")
+    for line in breaker.summary():
+        print(f"- {line}")
+    
+    if EXTRACTION_STATS:
+        print("\nCard extraction:")
+        for source, counts in EXTRACTION_STATS.items():
+            skipped = ", ".join(f"{key[len('skipped_'):]}: {count}" for key, count in counts.items() if key.startswith('skipped_'))
+            line = f"- {source}: {counts.get('extracted', 0)} of {counts.get('cards', 0)} cards fully extracted"
+            if skipped:
+                line += f" (skipped early on {skipped})"
+            print(line)
+    
     print("\n🏁 Job search complete! Results saved to Google Sheets.")
+    
+    # Remove spill files
+    if isinstance(all_jobs, SpillingJobStore):
+        all_jobs.close()
 
 if __name__ == "__main__":
-    # Add missing import
-    import sys
     main()
\ No newline at end of file
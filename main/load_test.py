@@ -0,0 +1,222 @@
+import argparse
+import itertools
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
+
+import job_scraper
+from glassdoor_locations import GlassdoorLocationResolver
+from html_snapshot import SnapshotPage
+from mock_board import MockBoardConfig, start_mock_board
+
+logger = logging.getLogger(__name__)
+
+# 📈 Sustained load test of the scraping pipeline against mock_board.py
+#
+# Runs many search queries concurrently through the real scrape_* functions
+# (URL building, pagination, card extraction) and reports throughput,
+# latency percentiles and memory. Pages are fetched over plain HTTP by
+# HttpDriver so a run measures the scraper, not Chrome; pass --browser to
+# give every worker its own headless Chrome via setup_driver() instead.
+
+QUERIES = [
+    "python developer", "data engineer", "rust developer", "software engineer",
+    "machine learning engineer", "devops engineer", "backend engineer", "site reliability engineer"
+]
+
+
+# Minimal WebDriver stand-in: get() downloads the page, find_elements() reads
+# the snapshot. Like a browser it renders error responses instead of raising.
+class HttpDriver:
+    def __init__(self, stats, timeout=30):
+        self.stats = stats
+        self.timeout = timeout
+        self.page_source = ""
+        self.current_url = None
+        self._page = SnapshotPage("")
+
+    def get(self, url):
+        start = time.perf_counter()
+        status = 200
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                html = response.read().decode('utf-8', errors='replace')
+        except HTTPError as e:
+            status = e.code
+            html = e.read().decode('utf-8', errors='replace')
+        except URLError as e:
+            status = None
+            html = ""
+            logger.warning(f"Request failed for {url}: {e}")
+        self.stats.record_page(time.perf_counter() - start, status)
+        self.page_source = html
+        self.current_url = url
+        self._page = SnapshotPage(html, url)
+
+    def find_elements(self, by, value):
+        return self._page.find_elements(by, value)
+
+    def quit(self):
+        pass
+
+
+class LoadStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.page_latencies = []
+        self.query_latencies = []
+        self.pages = 0
+        self.page_errors = 0
+        self.jobs = 0
+        self.queries = 0
+        self.rss_samples = []
+
+    def record_page(self, seconds, status):
+        with self.lock:
+            self.pages += 1
+            self.page_latencies.append(seconds)
+            if status != 200:
+                self.page_errors += 1
+
+    def record_query(self, seconds, job_count):
+        with self.lock:
+            self.queries += 1
+            self.jobs += job_count
+            self.query_latencies.append(seconds)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+# Current resident set size in MB (Linux), falling back to the peak
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def sample_memory(stats, stop, interval=0.5):
+    while not stop.wait(interval):
+        stats.rss_samples.append(current_rss_mb())
+
+
+def run_query(stats, query, sources, max_pages, use_browser):
+    driver = job_scraper.setup_driver() if use_browser else HttpDriver(stats)
+    start = time.perf_counter()
+    job_count = 0
+    try:
+        for source in sources:
+            scrape = job_scraper.SOURCE_SCRAPE_FUNCTIONS[source]
+            job_count += len(scrape(driver, query, "New York", {}, None, max_pages))
+    finally:
+        driver.quit()
+    stats.record_query(time.perf_counter() - start, job_count)
+
+
+def run_load_test(base_url, concurrency=50, duration=60, max_queries=None, max_pages=3,
+                  sources=None, use_browser=False):
+    sources = sources or list(job_scraper.SOURCE_BASE_URLS)
+    for source in job_scraper.SOURCE_BASE_URLS:
+        job_scraper.SOURCE_BASE_URLS[source] = base_url
+    job_scraper.DELAY_SCALE = 0
+    # The mock board's location IDs are fake; keep them out of the shared cache file
+    job_scraper.GLASSDOOR_LOCATIONS = GlassdoorLocationResolver(cache_path=None)
+
+    stats = LoadStats()
+    stop = threading.Event()
+    sampler = threading.Thread(target=sample_memory, args=(stats, stop), daemon=True)
+    sampler.start()
+
+    queries = itertools.cycle(QUERIES)
+    deadline = time.monotonic() + duration
+    issued = itertools.count()
+    started = time.perf_counter()
+
+    # Each worker keeps pulling queries until the duration (or query budget) runs out
+    def worker():
+        while time.monotonic() < deadline:
+            if max_queries is not None and next(issued) >= max_queries:
+                return
+            run_query(stats, next(queries), sources, max_pages, use_browser)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+
+    elapsed = time.perf_counter() - started
+    stop.set()
+    sampler.join()
+    return stats, elapsed
+
+
+def print_report(stats, elapsed, concurrency):
+    print("\n📈 Load Test Results:")
+    print(f"Concurrency: {concurrency}  Duration: {elapsed:.1f}s")
+    print(f"Queries: {stats.queries} ({stats.queries / elapsed:.2f}/s)")
+    print(f"Pages: {stats.pages} ({stats.pages / elapsed:.2f}/s), errors: {stats.page_errors}")
+    print(f"Jobs extracted: {stats.jobs} ({stats.jobs / elapsed:.1f}/s)")
+    for label, values in (("Page latency", stats.page_latencies), ("Query latency", stats.query_latencies)):
+        print(f"{label} (ms): p50={percentile(values, 50) * 1000:.1f} "
+              f"p90={percentile(values, 90) * 1000:.1f} p99={percentile(values, 99) * 1000:.1f} "
+              f"max={max(values, default=0) * 1000:.1f}")
+    if stats.rss_samples:
+        print(f"RSS (MB): start={stats.rss_samples[0]:.1f} end={stats.rss_samples[-1]:.1f} "
+              f"max={max(stats.rss_samples):.1f}")
+    print(f"Peak RSS (MB): {peak_rss_mb():.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the scrapers against a local mock job board')
+    parser.add_argument('--base_url', type=str, help='Use an already running mock board instead of starting one')
+    parser.add_argument('--concurrency', type=int, default=50, help='Number of concurrent queries')
+    parser.add_argument('--duration', type=float, default=60, help='Length of the run in seconds')
+    parser.add_argument('--queries', type=int, help='Stop after this many queries')
+    parser.add_argument('--pages', type=int, default=3, help='Maximum result pages per source')
+    parser.add_argument('--sources', type=str, nargs='+', choices=list(job_scraper.SOURCE_BASE_URLS), help='Sources to scrape')
+    parser.add_argument('--browser', action='store_true', help='Fetch with headless Chrome instead of plain HTTP')
+    parser.add_argument('--page_size', type=int, default=20, help='Mock board: job cards per page')
+    parser.add_argument('--results', type=int, default=100, help='Mock board: results per query')
+    parser.add_argument('--latency_ms', type=float, default=200, help='Mock board: mean response latency')
+    parser.add_argument('--jitter_ms', type=float, default=50, help='Mock board: latency standard deviation')
+    parser.add_argument('--error_rate', type=float, default=0.02, help='Mock board: fraction of blocked responses')
+    args = parser.parse_args()
+
+    # Per-page extraction logging would drown the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        config = MockBoardConfig(args.page_size, args.results, args.latency_ms, args.jitter_ms, args.error_rate)
+        server, base_url = start_mock_board(config)
+
+    print(f"🚦 Load testing against {base_url} with {args.concurrency} concurrent queries...")
+    try:
+        stats, elapsed = run_load_test(base_url, args.concurrency, args.duration, args.queries, args.pages,
+                                       args.sources, args.browser)
+    finally:
+        if server:
+            server.shutdown()
+    print_report(stats, elapsed, args.concurrency)
+
+if __name__ == "__main__":
+    main()
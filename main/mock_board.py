@@ -0,0 +1,270 @@
+import argparse
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 🧪 Local stand-in for the four job boards
+#
+# Serves synthetic, deterministic listing pages on the same paths and query
+# parameters the URL builders in job_scraper.py produce, using the first
+# selector each parse_*_page() function tries. Point the scraper at it with
+# `--base_url http://127.0.0.1:<port>`, or drive it with load_test.py.
+
+TITLES = [
+    "Software Engineer", "Senior Python Developer", "Data Engineer", "Backend Engineer",
+    "Rust Developer", "Machine Learning Engineer", "DevOps Engineer", "Frontend Developer",
+    "Full Stack Engineer", "Site Reliability Engineer", "Data Scientist", "Platform Engineer"
+]
+COMPANIES = [
+    "Acme Corp", "Globex", "Initech", "Umbrella Fintech", "Hooli", "Stark Industries",
+    "Wayne Capital", "Wonka Labs", "Soylent", "Tyrell Systems", "Cyberdyne", "Vandelay Industries"
+]
+SNIPPETS = [
+    "Build and maintain scalable services in Python and Go.",
+    "Work with a small team shipping data pipelines for payments.",
+    "Own CI/CD, observability and on-call tooling.",
+    "Design APIs used by millions of customers.",
+    "Experience with Rust, Kubernetes and PostgreSQL is a plus."
+]
+
+
+class MockBoardConfig:
+    def __init__(self, page_size=20, results=100, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=0):
+        self.page_size = page_size
+        self.results = results
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.seed = seed
+
+
+def _query_rng(config, *parts):
+    digest = hashlib.sha256("|".join([str(config.seed)] + [str(p) for p in parts]).encode('utf-8')).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+# Generate the synthetic postings for one query/page
+def generate_jobs(config, source, query, page_num):
+    start = page_num * config.page_size
+    count = max(0, min(config.page_size, config.results - start))
+    jobs = []
+    for i in range(start, start + count):
+        rng = _query_rng(config, source, query, i)
+        low = rng.randrange(60, 180) * 1000
+        jobs.append({
+            'id': f"{rng.randrange(10**10):010d}",
+            'title': f"{rng.choice(TITLES)} ({query})" if query else rng.choice(TITLES),
+            'company': rng.choice(COMPANIES),
+            'salary': f"${low:,} - ${low + rng.randrange(10, 60) * 1000:,} a year",
+            # Newest first, like the real boards
+            'days_old': i * 30 // max(config.results, 1),
+            'summary': rng.choice(SNIPPETS)
+        })
+    return jobs
+
+
+def _age_text(days_old):
+    return "Just posted" if days_old == 0 else f"{days_old} days ago"
+
+
+# Glassdoor style: "24h", "3d", "30d+"
+def _compact_age(days_old):
+    if days_old == 0:
+        return "24h"
+    return "30d+" if days_old >= 30 else f"{days_old}d"
+
+
+def render_indeed(jobs):
+    cards = []
+    for job in jobs:
+        cards.append(
+            f'<div class="job_seen_beacon">'
+            f'<h2 class="jobTitle"><a href="/rc/clk?jk={job["id"]}&job=1">{escape(job["title"])}</a></h2>'
+            f'<span class="companyName">{escape(job["company"])}</span>'
+            f'<div class="salary-snippet-container">{job["salary"]}</div>'
+            f'<span class="date">{_age_text(job["days_old"])}</span>'
+            f'<div class="job-snippet"><ul><li>{escape(job["summary"])}</li></ul></div>'
+            f'</div>'
+        )
+    return cards
+
+
+def render_glassdoor(jobs):
+    cards = []
+    for job in jobs:
+        cards.append(
+            f'<li class="react-job-listing" data-id="{job["id"]}">'
+            f'<a class="jobLink" data-test="job-link" href="/job-listing/{job["id"]}.htm">{escape(job["title"])}</a>'
+            f'<div class="employer-name">{escape(job["company"])}</div>'
+            f'<div class="salary-estimate">{job["salary"]}</div>'
+            f'<div data-test="job-age">{_compact_age(job["days_old"])}</div>'
+            f'<div class="jobDescriptionContent">{escape(job["summary"])}</div>'
+            f'</li>'
+        )
+    return cards
+
+
+def render_linkedin(jobs):
+    cards = []
+    for job in jobs:
+        posted = time.strftime("%Y-%m-%d", time.gmtime(time.time() - job["days_old"] * 86400))
+        cards.append(
+            f'<div class="base-search-card__info">'
+            f'<a href="/jobs/view/{job["id"]}"><h3 class="base-search-card__title">{escape(job["title"])}</h3></a>'
+            f'<h4 class="base-search-card__subtitle">{escape(job["company"])}</h4>'
+            f'<span class="job-search-card__salary-info">{job["salary"]}</span>'
+            f'<span class="job-search-card__location">Remote</span>'
+            f'<time datetime="{posted}">{_age_text(job["days_old"])}</time>'
+            f'</div>'
+        )
+    return cards
+
+
+def render_ziprecruiter(jobs):
+    cards = []
+    for job in jobs:
+        cards.append(
+            f'<article class="job_result" data-job-id="{job["id"]}">'
+            f'<h2 class="job_title"><a href="/jobs/{job["id"]}">{escape(job["title"])}</a></h2>'
+            f'<a class="hiring_company">{escape(job["company"])}</a>'
+            f'<span class="salary_estimate">{job["salary"]}</span>'
+            f'<span class="job_posted">{_age_text(job["days_old"])}</span>'
+            f'<p class="job_snippet">{escape(job["summary"])}</p>'
+            f'</article>'
+        )
+    return cards
+
+
+# /Job/<location>-<title>-jobs-SRCH_IL.0,<n>_IC<id>_KO<start>,<end>[_IP<page>].htm
+# or, without a location ID, /Job/<title>-jobs-SRCH_KO0,<n>[_IP<page>].htm
+GLASSDOOR_PATH_RE = re.compile(
+    r"^/Job/(?P<slug>[^/]+)-jobs-SRCH_(?:[^/]*?_)?KO(?P<start>\d+),(?P<end>\d+)(?:_IP(?P<page>\d+))?\.htm$"
+)
+
+
+# Map a request path + query onto (source, query text, 0-based page number)
+def route(path, params):
+    def first(name, default=""):
+        return params.get(name, [default])[0]
+
+    if path == "/jobs":
+        return "Indeed", first("q"), int(first("start", "0") or 0) // 10
+    if path.rstrip('/') == "/jobs/search":
+        return "LinkedIn", first("keywords"), int(first("start", "0") or 0) // 25
+    if path == "/jobs-search":
+        return "ZipRecruiter", first("search"), max(int(first("page", "1") or 1) - 1, 0)
+    match = GLASSDOOR_PATH_RE.match(path)
+    if match:
+        title = match.group("slug")[int(match.group("start")):int(match.group("end"))]
+        return "Glassdoor", title.replace('-', ' '), max(int(match.group("page") or 1) - 1, 0)
+    return None
+
+
+RENDERERS = {
+    'Indeed': render_indeed,
+    'Glassdoor': render_glassdoor,
+    'LinkedIn': render_linkedin,
+    'ZipRecruiter': render_ziprecruiter
+}
+
+
+def render_page(config, source, query, page_num):
+    cards = RENDERERS[source](generate_jobs(config, source, query, page_num))
+    return (
+        f"<html><head><title>{source} mock - {escape(query)}</title></head><body>"
+        f"<main>{''.join(cards)}</main></body></html>"
+    )
+
+
+class MockBoardHandler(BaseHTTPRequestHandler):
+    config = MockBoardConfig()
+
+    def do_GET(self):
+        config = self.config
+        if config.latency_ms or config.jitter_ms:
+            time.sleep(max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000)
+
+        parts = urlsplit(self.path)
+        if parts.path == "/findPopularLocationAjax.htm":
+            self._send_locations(parse_qs(parts.query).get("term", [""])[0])
+            return
+
+        routed = route(parts.path, parse_qs(parts.query))
+        if routed is None:
+            self._send(404, "<html><body>Not found</body></html>")
+            return
+
+        if config.error_rate and random.random() < config.error_rate:
+            # What a rate-limited board looks like to the scraper: a page with no job cards
+            self._send(503, "<html><body><div id='captcha'>Please verify you are a human</div></body></html>")
+            return
+
+        self._send(200, render_page(config, *routed))
+
+    # Glassdoor location autocomplete: a stable fake city ID per search term
+    def _send_locations(self, term):
+        location_id = int(hashlib.sha256(term.lower().encode('utf-8')).hexdigest()[:6], 16)
+        body = json.dumps([{'label': term, 'locationId': location_id, 'locationType': 'C'}] if term else [])
+        self._send(200, body, "application/json")
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+# Start the mock board on a background thread; returns (server, base_url)
+def start_mock_board(config=None, host="127.0.0.1", port=0):
+    handler = type("ConfiguredMockBoardHandler", (MockBoardHandler,), {'config': config or MockBoardConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_address[1]}"
+    logger.info(f"Mock job board listening on {base_url}")
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock job board for end-to-end and load testing')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--page_size', type=int, default=20, help='Job cards per page')
+    parser.add_argument('--results', type=int, default=100, help='Total results per query (controls pagination)')
+    parser.add_argument('--latency_ms', type=float, default=0, help='Mean response latency in milliseconds')
+    parser.add_argument('--jitter_ms', type=float, default=0, help='Standard deviation of response latency')
+    parser.add_argument('--error_rate', type=float, default=0.0, help='Fraction of requests answered with a 503 block page')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the generated listings')
+    args = parser.parse_args()
+
+    config = MockBoardConfig(args.page_size, args.results, args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    server, base_url = start_mock_board(config, args.host, args.port)
+    print(f"🧪 Mock job board running at {base_url} (Ctrl+C to stop)")
+    print(f"   python job_scraper.py --job_title 'python developer' --base_url {base_url} --no_delay --pages 3")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
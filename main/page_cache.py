@@ -0,0 +1,221 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Filters that change what a listing page contains. Post-scrape criteria
+# (keywords, companies, sources, max_days_old) are deliberately left out so
+# re-filtering a run reuses the same cached pages.
+PAGE_FILTER_KEYS = ('date_posted', 'job_type', 'experience_level', 'salary_min', 'remote')
+
+
+def normalize_url(url):
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def page_key(url, filters=None):
+    page_filters = {k: filters[k] for k in PAGE_FILTER_KEYS if filters and filters.get(k)}
+    payload = json.dumps([normalize_url(url), page_filters], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# 🗄️ Content-addressed cache of listing page HTML
+#
+# index.json maps a page key (normalized URL + page filters) to the SHA-256
+# of the stored HTML; the HTML itself lives gzip-compressed under
+# objects/<sha[:2]>/<sha>.html.gz, so identical pages are stored once.
+# Entries expire after ttl seconds (None = never) and the least recently
+# used ones are evicted once the objects exceed max_bytes on disk.
+#
+# Index changes are kept in memory and written every SAVE_EVERY changes and
+# on flush(), so a hit costs one object read rather than an index rewrite.
+# Objects are reference counted and deleted when their last entry goes; a
+# session that never flushed leaves a marker, and the next one sweeps up
+# whatever objects it left unindexed.
+
+# Index changes between saves
+SAVE_EVERY = 50
+
+# Eviction frees space down to this fraction of max_bytes, so it runs once per batch of puts
+EVICT_TO = 0.9
+
+
+class PageCache:
+    def __init__(self, cache_dir, ttl=24 * 3600, max_bytes=200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.dirty_path = os.path.join(cache_dir, 'index.dirty')
+        self.hits = 0
+        self.misses = 0
+        self.unsaved = 0
+        self.touched = False
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index = self._load_index()
+
+        # Entries per object and object sizes, kept up to date as entries come and go
+        self.refs = {}
+        self.sizes = {}
+        self.total_bytes = 0
+        for entry in self.index.values():
+            self._ref(entry)
+
+        if os.path.exists(self.dirty_path):
+            # The last session ended without saving its index
+            self._remove_orphans()
+            os.remove(self.dirty_path)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Page cache index unreadable, starting fresh: {e}")
+            return {}
+
+    def _save_index(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _changed(self):
+        if not self.unsaved:
+            # Mark the session unsaved before anything can be lost
+            open(self.dirty_path, 'w').close()
+        self.unsaved += 1
+        if self.unsaved >= SAVE_EVERY:
+            self.flush()
+
+    # Write pending index changes to disk
+    def flush(self):
+        if self.unsaved or self.touched:
+            self._save_index()
+            self.unsaved = 0
+            self.touched = False
+            if os.path.exists(self.dirty_path):
+                os.remove(self.dirty_path)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.html.gz")
+
+    def _expired(self, entry):
+        return self.ttl is not None and time.time() - entry['stored_at'] > self.ttl
+
+    def _ref(self, entry):
+        if entry['sha'] not in self.refs:
+            self.sizes[entry['sha']] = entry['size']
+            self.total_bytes += entry['size']
+        self.refs[entry['sha']] = self.refs.get(entry['sha'], 0) + 1
+
+    # Remove an index entry, deleting its object if nothing else points at it
+    def _drop(self, key):
+        digest = self.index.pop(key)['sha']
+        self.refs[digest] -= 1
+        if not self.refs[digest]:
+            del self.refs[digest]
+            self.total_bytes -= self.sizes.pop(digest)
+            try:
+                os.remove(self._object_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def get(self, url, filters=None):
+        cached = self.get_with_time(url, filters)
+        return cached[0] if cached else None
+
+    # (html, stored_at epoch seconds) or None; stored_at anchors relative dates on replay
+    def get_with_time(self, url, filters=None):
+        key = page_key(url, filters)
+        entry = self.index.get(key)
+        if not entry or self._expired(entry):
+            self.misses += 1
+            return None
+
+        try:
+            with gzip.open(self._object_path(entry['sha']), 'rt', encoding='utf-8') as f:
+                html = f.read()
+        except OSError:
+            # Object was evicted or removed behind our back
+            self._drop(key)
+            self._changed()
+            self.misses += 1
+            return None
+
+        # Only recency changes on a hit; losing it in a crash costs nothing but LRU precision
+        entry['last_access'] = time.time()
+        self.touched = True
+        self.hits += 1
+        return html, entry['stored_at']
+
+    def put(self, url, html, filters=None):
+        key = page_key(url, filters)
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+
+        # Marked before the object lands, so a crash before the next save gets it swept
+        self._changed()
+        if digest not in self.refs:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(gzip.compress(data))
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        entry = {
+            'url': url,
+            'sha': digest,
+            'size': os.path.getsize(path),
+            'stored_at': now,
+            'last_access': now
+        }
+        # Take the new reference first so re-storing identical HTML keeps its object
+        self._ref(entry)
+        if key in self.index:
+            self._drop(key)
+        self.index[key] = entry
+        self._evict()
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        # Drop expired entries first, then least recently used until under budget
+        for key in [k for k, e in self.index.items() if self._expired(e)]:
+            self._drop(key)
+        target = self.max_bytes * EVICT_TO
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1]['last_access']):
+            if self.total_bytes <= target:
+                break
+            self._drop(key)
+
+    def _remove_orphans(self):
+        for subdir in os.listdir(self.objects_dir):
+            subpath = os.path.join(self.objects_dir, subdir)
+            if not os.path.isdir(subpath):
+                continue
+            for name in os.listdir(subpath):
+                if name.endswith('.tmp') or (name.endswith('.html.gz') and name[:-len('.html.gz')] not in self.refs):
+                    os.remove(os.path.join(subpath, name))
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.index)}
@@ -0,0 +1,93 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+# 📅 Normalize the boards' "posted" text into absolute UTC timestamps
+#
+# Indeed / ZipRecruiter: "Just posted", "Today", "Posted 3 days ago",
+#   "Active 5 days ago", "30+ days ago", "5 hours ago"
+# Glassdoor: compact ages such as "24h", "3d", "30d+"
+# LinkedIn: ISO dates from <time datetime="2024-05-01">, or "1 week ago"
+# Relative ages are resolved against the time the page was fetched.
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+UNIT_SECONDS = {
+    'minute': 60, 'min': 60, 'm': 60,
+    'hour': 3600, 'hr': 3600, 'h': 3600,
+    'day': 86400, 'd': 86400,
+    'week': 7 * 86400, 'wk': 7 * 86400, 'w': 7 * 86400,
+    'month': 30 * 86400, 'mo': 30 * 86400,
+    'year': 365 * 86400, 'yr': 365 * 86400, 'y': 365 * 86400
+}
+
+JUST_POSTED_RE = re.compile(r"\b(just posted|just now|today|new)\b")
+YESTERDAY_RE = re.compile(r"\byesterday\b")
+RELATIVE_RE = re.compile(r"(\d+)\s*\+?\s*(minute|min|hour|hr|day|week|wk|month|mo|year|yr)s?\b")
+COMPACT_RE = re.compile(r"^(\d+)\s*(m|h|d|w|mo|y)\+?$")
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+US_DATE_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+
+
+def _as_utc(value):
+    if value is None:
+        return datetime.now(timezone.utc)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+# Absolute UTC datetime for a posted-date string, or None if it can't be read.
+# `fetched_at` (datetime or epoch seconds) anchors relative ages; defaults to now.
+def parse_posted_date(text, fetched_at=None):
+    if not text or text.strip() in ("", "N/A"):
+        return None
+    raw = text.strip()
+
+    # Already absolute: ISO timestamps (LinkedIn, or previously normalized values)
+    if ISO_DATE_RE.match(raw):
+        try:
+            return _as_utc(datetime.fromisoformat(raw.replace("Z", "+00:00")))
+        except ValueError:
+            pass
+    match = US_DATE_RE.search(raw)
+    if match:
+        month, day, year = (int(g) for g in match.groups())
+        try:
+            return datetime(year, month, day, tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    reference = _as_utc(fetched_at)
+    lowered = raw.lower()
+
+    # An explicit age wins over badge words, so "New\n3 days ago" is 3 days old
+    match = RELATIVE_RE.search(lowered) or COMPACT_RE.match(lowered)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        # "30+ days ago" is a lower bound on age, which is what the cutoff needs
+        return reference - timedelta(seconds=amount * UNIT_SECONDS[unit])
+    if YESTERDAY_RE.search(lowered):
+        return reference - timedelta(days=1)
+    if JUST_POSTED_RE.search(lowered):
+        return reference
+    return None
+
+
+def format_timestamp(moment):
+    return moment.strftime(TIMESTAMP_FORMAT)
+
+
+# Value for the "Date Posted" column: normalized timestamp when readable, raw text otherwise
+def normalize_posted_date(text, fetched_at=None):
+    moment = parse_posted_date(text, fetched_at)
+    return format_timestamp(moment) if moment else text
+
+
+# Whole days since posting (so "3 days ago" stays 3 a few hours later), or None
+def age_in_days(text, now=None):
+    moment = parse_posted_date(text, now)
+    if moment is None:
+        return None
+    return int((_as_utc(now) - moment).total_seconds() // 86400)
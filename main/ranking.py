@@ -0,0 +1,96 @@
+import heapq
+import math
+import re
+
+# 🏅 BM25 relevance ranking of scraped jobs against the search query
+#
+# Corpus statistics (document count, average title and summary length,
+# document frequency of the query terms) are updated one job at a time with
+# add(), so the ranker can be fed while sources are still being scraped.
+# Scoring only needs the query terms, so nothing per-document is kept in
+# memory; top_k() streams over the jobs with a bounded heap and only the K
+# best survive.
+#
+# Title and summary are length-normalised separately (BM25F): sources differ
+# a lot in what they put in the summary (LinkedIn's is just the location),
+# and a short summary must not make an equally good title match score higher.
+
+# Keeps tech names like c++, c# and node.js intact
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with", "at"}
+
+# Matches in the title count this many times as much as matches in the summary
+TITLE_WEIGHT = 2
+
+
+def tokenize(text):
+    if not text or text == "N/A":
+        return []
+    return TOKEN_RE.findall(text.lower())
+
+
+class RelevanceRanker:
+    def __init__(self, job_title, keywords=None, k1=1.2, b=0.75):
+        query = tokenize(job_title)
+        for keyword in keywords or []:
+            query.extend(tokenize(keyword))
+        # Preserve order but drop duplicates and filler words
+        self.query_terms = [t for t in dict.fromkeys(query) if t not in STOPWORDS]
+        self.k1 = k1
+        self.b = b
+        self.doc_count = 0
+        self.title_length = 0
+        self.summary_length = 0
+        self.doc_freq = {term: 0 for term in self.query_terms}
+
+    # {term: (title count, summary count)} for the query terms, plus the two field lengths
+    def _term_stats(self, job):
+        doc_freq = self.doc_freq
+        title_tokens = tokenize(job[1])
+        summary_tokens = tokenize(job[6])
+        counts = {}
+        for token in title_tokens:
+            if token in doc_freq:
+                in_title, in_summary = counts.get(token, (0, 0))
+                counts[token] = (in_title + 1, in_summary)
+        for token in summary_tokens:
+            if token in doc_freq:
+                in_title, in_summary = counts.get(token, (0, 0))
+                counts[token] = (in_title, in_summary + 1)
+        return counts, len(title_tokens), len(summary_tokens)
+
+    def add(self, job):
+        counts, title_length, summary_length = self._term_stats(job)
+        self.doc_count += 1
+        self.title_length += title_length
+        self.summary_length += summary_length
+        for term in counts:
+            self.doc_freq[term] += 1
+
+    def add_many(self, jobs):
+        for job in jobs:
+            self.add(job)
+
+    def _length_norm(self, length, total_length):
+        avg_length = total_length / self.doc_count or 1
+        return 1 - self.b + self.b * length / avg_length
+
+    def score(self, job):
+        if not self.doc_count:
+            return 0.0
+        counts, title_length, summary_length = self._term_stats(job)
+        title_norm = self._length_norm(title_length, self.title_length)
+        summary_norm = self._length_norm(summary_length, self.summary_length)
+        score = 0.0
+        for term, (in_title, in_summary) in counts.items():
+            df = self.doc_freq[term]
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            tf = TITLE_WEIGHT * in_title / title_norm + in_summary / summary_norm
+            score += idf * tf * (self.k1 + 1) / (tf + self.k1)
+        return score
+
+    # Best k jobs, highest score first (ties keep input order); k=None ranks everything
+    def top_k(self, jobs, k=None):
+        if k is None:
+            return sorted(jobs, key=self.score, reverse=True)
+        return heapq.nlargest(k, jobs, key=self.score)
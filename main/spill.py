@@ -0,0 +1,209 @@
+import heapq
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# 💾 Bounded-memory job storage for very large runs
+#
+# SpillingJobStore stands in for the `all_jobs` list: jobs are buffered in
+# memory, tagged with the order they were scraped in, until the buffer's
+# estimated size passes the budget; then they are sorted by dedup key and
+# written out as a run file. Iterating the store does a streaming k-way
+# merge of all runs (plus the in-memory tail) that keeps the first copy of
+# each posting, then puts the survivors back in scrape order with a second
+# external sort. Filtering, ranking and export therefore see exactly what
+# unique_jobs() gives for a plain list, without the whole result set ever
+# being held in memory.
+
+# Merge runs into one once there are this many, to bound open files during the final merge
+MAX_MERGE_FANIN = 64
+
+HEADER = ["Source", "Job Title", "Company", "Salary", "Job Link", "Date Posted", "Summary"]
+
+
+# Same posting scraped twice (another page, another query) = same source, title, company
+# and link; postings without a link fall back to the first three
+def dedup_key(job):
+    link = job[4] if len(job) > 4 and job[4] not in (None, "", "N/A") else ""
+    return (job[0], job[1].strip().lower(), job[2].strip().lower(), link)
+
+
+# First copy of each posting, in scrape order
+def unique_jobs(jobs):
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = dedup_key(job)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+def estimate_size(job):
+    return sys.getsizeof(job) + sum(sys.getsizeof(field) for field in job)
+
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _write_run(path, records):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+# Run records are [scrape sequence number, job]
+def _by_key(record):
+    return (dedup_key(record[1]), record[0])
+
+
+def _by_seq(record):
+    return record[0]
+
+
+# Append-only job file that can be iterated any number of times
+class JobSpool:
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def append(self, job):
+        self._file.write(json.dumps(job) + "\n")
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __iter__(self):
+        if not self._file.closed:
+            self._file.flush()
+        return _read_run(self.path)
+
+
+class SpillingJobStore:
+    def __init__(self, memory_budget_bytes, tmp_dir=None):
+        self.memory_budget = memory_budget_bytes
+        self.work_dir = tempfile.mkdtemp(prefix='jobscout_spill_', dir=tmp_dir)
+        self.buffer = []
+        self.buffer_bytes = 0
+        self.runs = []
+        self._run_files = 0
+        self.added = 0
+        self._unique_count = 0
+        self._spools = 0
+
+    def append(self, job):
+        self.buffer.append([self.added, job])
+        self.buffer_bytes += estimate_size(job)
+        self.added += 1
+        self._unique_count = None
+        if self.buffer_bytes > self.memory_budget:
+            self._spill()
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+
+    def _new_run_path(self):
+        self._run_files += 1
+        return os.path.join(self.work_dir, f"run_{self._run_files:05d}.jsonl")
+
+    def _spill(self):
+        self.buffer.sort(key=_by_key)
+        path = self._new_run_path()
+        _write_run(path, self.buffer)
+        self.runs.append(path)
+        logger.info(f"Spilled {len(self.buffer)} jobs ({self.buffer_bytes / 1024 / 1024:.1f} MB) to {path}")
+        self.buffer = []
+        self.buffer_bytes = 0
+        if len(self.runs) >= MAX_MERGE_FANIN:
+            self.runs = [self._compact(self.runs, _by_key, unique=True)]
+
+    # Merge sorted runs into a single run file and delete them
+    def _compact(self, runs, key, unique=False):
+        path = self._new_run_path()
+        merged = heapq.merge(*[_read_run(run) for run in runs], key=key)
+        _write_run(path, self._drop_duplicates(merged) if unique else merged)
+        for run in runs:
+            os.remove(run)
+        return path
+
+    # Records arrive in (dedup key, sequence) order, so the first of each key is the earliest scraped
+    def _drop_duplicates(self, records):
+        last_key = None
+        for record in records:
+            key = dedup_key(record[1])
+            if key != last_key:
+                last_key = key
+                yield record
+
+    def __len__(self):
+        # Unique jobs, counted with a streaming pass and remembered until the next append
+        if self._unique_count is None:
+            self._unique_count = sum(1 for _ in self)
+        return self._unique_count
+
+    def __bool__(self):
+        return self.added > 0
+
+    # Unique jobs in scrape order
+    def __iter__(self):
+        self.buffer.sort(key=_by_key)
+        streams = [_read_run(path) for path in self.runs] + [iter(self.buffer)]
+        unique = self._drop_duplicates(heapq.merge(*streams, key=_by_key))
+        return self._in_scrape_order(unique)
+
+    # External sort of the unique records back into sequence order, within the memory budget
+    def _in_scrape_order(self, records):
+        order_runs = []
+        chunk, chunk_bytes = [], 0
+        try:
+            for record in records:
+                chunk.append(record)
+                chunk_bytes += estimate_size(record[1])
+                if chunk_bytes > self.memory_budget:
+                    chunk.sort(key=_by_seq)
+                    path = self._new_run_path()
+                    _write_run(path, chunk)
+                    order_runs.append(path)
+                    chunk, chunk_bytes = [], 0
+                    if len(order_runs) >= MAX_MERGE_FANIN:
+                        order_runs = [self._compact(order_runs, _by_seq)]
+            chunk.sort(key=_by_seq)
+            streams = [_read_run(path) for path in order_runs] + [iter(chunk)]
+            for _, job in heapq.merge(*streams, key=_by_seq):
+                yield job
+        finally:
+            for path in order_runs:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    # Stream the unique jobs that pass `predicate` into a re-iterable on-disk spool
+    def filtered(self, predicate):
+        spool = JobSpool(os.path.join(self.work_dir, f"filtered_{self._spools:03d}.jsonl"))
+        self._spools += 1
+        for job in self:
+            if predicate(job):
+                spool.append(job)
+        spool.close()
+        return spool
+
+    def close(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
@@ -0,0 +1,115 @@
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# 🗂️ Run many page loads concurrently in the tabs of one browser
+#
+# driver.get() blocks until the page has loaded, so a single driver only
+# ever has one request in flight and each extra browser costs a whole
+# Chrome process. Instead, each tab is pointed at its URL from JavaScript
+# (which returns immediately), so every tab loads in parallel; the
+# scheduler then cycles through the tabs and hands each one to its task's
+# callback as soon as its document has finished loading and its minimum
+# dwell time has passed. Callbacks may return follow-up tasks (e.g. the
+# next result page), which go to the next free tab. Work can also be pulled
+# lazily through `next_task`, which is only asked when a tab is free, so
+# decisions about what to load next are made as late as possible.
+
+# Set on the old document right before navigating away; a tab is loaded
+# once a document without the marker reports readyState "complete"
+NAVIGATE_SCRIPT = "window.__jobscoutPending = true; window.location.href = arguments[0];"
+READY_SCRIPT = "return document.readyState === 'complete' && !window.__jobscoutPending;"
+
+
+class TabTask:
+    def __init__(self, url, on_ready, dwell=0.0, label=None):
+        self.url = url
+        # on_ready(driver) runs with the task's tab selected; returns follow-up tasks or None
+        self.on_ready = on_ready
+        # Minimum seconds between starting the load and harvesting (human-like pacing)
+        self.dwell = dwell
+        self.label = label or url
+
+
+class TabScheduler:
+    def __init__(self, driver, tab_count=4, load_timeout=30, poll_interval=0.05):
+        self.driver = driver
+        self.tab_count = max(1, tab_count)
+        self.load_timeout = load_timeout
+        self.poll_interval = poll_interval
+        self.loads = 0
+        self.timeouts = 0
+
+    def _open_tabs(self):
+        handles = [self.driver.current_window_handle]
+        while len(handles) < self.tab_count:
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        return handles
+
+    def _close_tabs(self, handles):
+        for handle in handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception as e:
+                logger.warning(f"Could not close tab: {e}")
+        self.driver.switch_to.window(handles[0])
+
+    def _start(self, handle, task):
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(NAVIGATE_SCRIPT, task.url)
+        started = time.monotonic()
+        return task, started, started + task.dwell
+
+    def _harvest(self, task):
+        try:
+            return list(task.on_ready(self.driver) or [])
+        except Exception as e:
+            logger.error(f"Error handling {task.label}: {e}")
+            return []
+
+    # Run `tasks`, every follow-up task they produce and whatever next_task()
+    # hands out (None = nothing to start right now), until no work is left
+    def run(self, tasks=(), next_task=None):
+        pending = deque(tasks)
+        handles = self._open_tabs()
+        idle = deque(handles)
+        active = {}
+        try:
+            while True:
+                while idle:
+                    task = pending.popleft() if pending else (next_task() if next_task else None)
+                    if task is None:
+                        break
+                    handle = idle.popleft()
+                    active[handle] = self._start(handle, task)
+                if not active:
+                    # All tabs idle and nothing left to start
+                    break
+
+                harvested = False
+                for handle, (task, started, ready_after) in list(active.items()):
+                    now = time.monotonic()
+                    if now < ready_after:
+                        continue
+                    self.driver.switch_to.window(handle)
+                    timed_out = now - started > self.load_timeout
+                    if not timed_out and not self.driver.execute_script(READY_SCRIPT):
+                        continue
+                    if timed_out:
+                        # Harvest whatever rendered; the parser decides whether it's usable
+                        self.timeouts += 1
+                        logger.warning(f"{task.label} still loading after {self.load_timeout}s")
+                    del active[handle]
+                    idle.append(handle)
+                    self.loads += 1
+                    pending.extend(self._harvest(task))
+                    harvested = True
+
+                if not harvested:
+                    time.sleep(self.poll_interval)
+        finally:
+            self._close_tabs(handles)